@@ -23,19 +23,262 @@ Usage:
     # Production (with Gunicorn)
     gunicorn -w 4 -b 0.0.0.0:5000 "backend.app:create_app('production')"
     
+    # Production with gevent workers (IO-bound API; see the __main__ block)
+    DB_POOL_SIZE=50 gunicorn -k gevent -w $(nproc) --worker-connections 1000 "backend.app:create_app('production')"
+    
+    # Realistic local performance testing (gevent worker, pip install gevent)
+    # One worker multiplexes many connections, yielding while waiting on the DB
+    gunicorn -k gevent -w 1 --worker-connections 1000 "backend.app:create_app('development')"
+    
     # Testing
     app = create_app('testing')
+    with app.app_context():
+        db.create_all()  # Schema bootstrap is explicit, never done by the factory
     test_client = app.test_client()
 """
 
 import os
-from flask import Flask, jsonify
-from backend.config import config
-from backend.src.extensions import db, jwt, cors
-from backend.src.api import api_bp
+import sys
+import json
+from functools import lru_cache
+from flask import Flask, Response, request
+from sqlalchemy import text
+from backend.config import config_settings
+from backend.src.extensions import db, jwt, cache
+from backend.src.utils.serialization import FastJSONProvider
+
+
+def _json_body(payload):
+    """
+    Serialize a static response payload to JSON bytes.
+    
+    Args:
+        payload (dict): JSON-serializable response data
+    
+    Returns:
+        bytes: Compact UTF-8 encoded JSON
+    """
+    return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
+
+def _prebuilt_response(payload, status):
+    """
+    Build a reusable (body, status, headers) response tuple for a static payload.
+    
+    Error handlers return the tuple as-is; Flask turns it into a Response
+    without re-encoding the already serialized body.
+    
+    Args:
+        payload (dict): JSON-serializable response data
+        status (int): HTTP status code
+    
+    Returns:
+        tuple: (bytes body, status code, headers dict)
+    """
+    body = _json_body(payload)
+    headers = {
+        'Content-Type': 'application/json',
+        'Content-Length': str(len(body))
+    }
+    return body, status, headers
+
+
+@lru_cache(maxsize=32)
+def _canned_body(route, environment):
+    """
+    Serialized JSON body for a static app-level route, memoized per environment.
+    
+    The payloads only vary by environment name, so every app built with the
+    same configuration (e.g. hundreds of test apps) reuses the same bytes.
+    
+    Args:
+        route (str): Route name ('health' or 'index')
+        environment (str): Configuration name the app was created with
+    
+    Returns:
+        bytes: Compact UTF-8 encoded JSON body
+    """
+    payloads = {
+        'health': {
+            'status': 'healthy',
+            'environment': environment
+        },
+        'index': {
+            'message': 'Task Management API',
+            'version': '1.0.0',
+            'endpoints': {
+                'health': '/health',
+                'api': '/api',
+                'tasks': '/api/tasks',
+                'docs': '/api/docs'  # TODO: Add when API documentation is implemented
+            }
+        }
+    }
+    return _json_body(payloads[route])
+
+
+# API blueprint, imported on first use (see _get_api_blueprint)
+_cached_api_bp = None
+
+
+def _get_api_blueprint():
+    """
+    Import the API blueprint lazily and cache it for later factory calls.
+    
+    Loading the routes pulls in every route module, the service layer and
+    all models. Deferring it keeps `import backend.app` (and
+    `import backend.src.api`) cheap and lets
+    create_app(register_blueprints=False) skip that work entirely.
+    
+    Returns:
+        Blueprint: The /api blueprint with all routes attached
+    """
+    global _cached_api_bp
+    if _cached_api_bp is None:
+        from backend.src.api import load_routes
+        _cached_api_bp = load_routes()
+    return _cached_api_bp
+
+
+# ============================================================================
+# JWT Error Callbacks
+# ============================================================================
+
+# Responses for authentication failures. They are identical for every app,
+# so they are prebuilt once at import time and the callbacks are defined
+# once here instead of being rebuilt as closures on every create_app() call.
+
+_TOKEN_EXPIRED_RESPONSE = _prebuilt_response({
+    'error': 'Token expired',
+    'message': 'The authentication token has expired. Please login again.'
+}, 401)
+
+_TOKEN_INVALID_RESPONSE = _prebuilt_response({
+    'error': 'Invalid token',
+    'message': 'The authentication token is invalid. Please login again.'
+}, 401)
+
+_TOKEN_MISSING_RESPONSE = _prebuilt_response({
+    'error': 'Authorization required',
+    'message': 'Request does not contain a valid authentication token. Please login.'
+}, 401)
+
+_TOKEN_REVOKED_RESPONSE = _prebuilt_response({
+    'error': 'Token revoked',
+    'message': 'The authentication token has been revoked. Please login again.'
+}, 401)
+
+_TOKEN_NOT_FRESH_RESPONSE = _prebuilt_response({
+    'error': 'Fresh token required',
+    'message': 'This operation requires a fresh authentication token. Please login again.'
+}, 401)
+
+
+def expired_token_callback(jwt_header, jwt_payload):
+    """
+    Handle expired JWT tokens
+    
+    Triggered when user's JWT access token has expired
+    Client should request a new token using refresh token
+    
+    Args:
+        jwt_header: JWT header containing token metadata
+        jwt_payload: JWT payload containing user claims and expiration
+    
+    Returns:
+        JSON error response with 401 status
+    """
+    return _TOKEN_EXPIRED_RESPONSE
+
+
+def invalid_token_callback(error):
+    """
+    Handle invalid JWT tokens
+    
+    Triggered when:
+    - Token signature is invalid (tampered with)
+    - Token format is malformed
+    - Token algorithm doesn't match expected
+    - Token is corrupted
+    
+    Args:
+        error: Error message describing why token is invalid
+    
+    Returns:
+        JSON error response with 401 status
+    """
+    return _TOKEN_INVALID_RESPONSE
 
 
-def create_app(config_name=None):
+def missing_token_callback(error):
+    """
+    Handle missing JWT tokens
+    
+    Triggered when:
+    - No Authorization header is provided
+    - Authorization header doesn't start with 'Bearer '
+    - Endpoint requires JWT but none provided
+    - Token is empty or whitespace only
+    
+    Args:
+        error: Error message describing the authorization issue
+    
+    Returns:
+        JSON error response with 401 status
+    """
+    return _TOKEN_MISSING_RESPONSE
+
+
+def revoked_token_callback(jwt_header, jwt_payload):
+    """
+    Handle revoked JWT tokens
+    
+    Triggered when:
+    - Token has been explicitly revoked (user logout, password change, etc.)
+    - Token is in revocation list/blacklist
+    
+    Note: Requires token revocation implementation (Redis/database)
+    To use this, implement a token blocklist with Flask-JWT-Extended
+    
+    Args:
+        jwt_header: JWT header data
+        jwt_payload: JWT payload data (contains user_id, expiration, etc.)
+    
+    Returns:
+        JSON error response with 401 status
+    """
+    return _TOKEN_REVOKED_RESPONSE
+
+
+def token_not_fresh_callback(jwt_header, jwt_payload):
+    """
+    Handle non-fresh tokens for sensitive operations
+    
+    Triggered when:
+    - Operation requires fresh token (recent login)
+    - User is using a token obtained via refresh (not original login)
+    - Sensitive operations require re-authentication
+    
+    Fresh tokens are issued on direct login
+    Non-fresh tokens are issued via refresh endpoint
+    
+    Use @jwt_required(fresh=True) for sensitive operations like:
+    - Changing password
+    - Updating email
+    - Deleting account
+    - Making payments
+    
+    Args:
+        jwt_header: JWT header data
+        jwt_payload: JWT payload data
+    
+    Returns:
+        JSON error response with 401 status
+    """
+    return _TOKEN_NOT_FRESH_RESPONSE
+
+
+def create_app(config_name=None, register_blueprints=True):
     """
     Application Factory - Creates and configures a Flask application instance.
     
@@ -47,10 +290,18 @@ def create_app(config_name=None):
             Valid values: 'development', 'production', 'testing'
             If None, reads from FLASK_ENV environment variable
             Defaults to 'development' if FLASK_ENV not set
+        register_blueprints (bool, optional): Register the /api blueprint.
+            Defaults to True. Narrow unit tests that only exercise app-level
+            routes (e.g. /health) can pass False to skip importing the routes,
+            service layer and models.
     
     Returns:
         Flask: Fully configured Flask application instance ready to run
     
+    Database Schema:
+        The factory never touches the database. Create tables explicitly with
+        `flask init-db` (or db.create_all() inside an app context in tests).
+    
     Configuration Precedence:
         1. Explicit config_name parameter (highest priority)
         2. FLASK_ENV environment variable
@@ -66,6 +317,9 @@ def create_app(config_name=None):
         
         # Default
         app = create_app()  # Uses 'development' config
+        
+        # App-level routes only (no /api blueprint)
+        app = create_app('testing', register_blueprints=False)
     """
     
     # ========================================================================
@@ -75,6 +329,10 @@ def create_app(config_name=None):
     # __name__ helps Flask locate templates, static files, etc.
     app = Flask(__name__)
     
+    # Serialize JSON with orjson when it is installed (used by jsonify and
+    # request.get_json); falls back to Flask's stdlib-based provider
+    app.json = FastJSONProvider(app)
+    
     
     # ========================================================================
     # STEP 2: Load Configuration
@@ -86,12 +344,29 @@ def create_app(config_name=None):
         config_name = os.environ.get('FLASK_ENV', 'development')
     
     # Load configuration from config.py
-    # config[config_name] returns the appropriate Config class
-    # from_object() loads all UPPERCASE attributes from the class
-    app.config.from_object(config[config_name])
+    # config_settings[config_name] holds the UPPERCASE attributes of the matching
+    # Config class, extracted once at import time (same keys from_object() would
+    # find, without re-scanning the class on every factory call)
+    app.config.from_mapping(config_settings[config_name])
+    
+    # Frozen copy of the same settings for request-time reads (e.g. pagination
+    # defaults in the task routes): a read-only MappingProxyType instead of
+    # app.config. Reflects config.py only - later app.config changes aren't seen
+    app.extensions['frozen_config'] = config_settings[config_name]
+    
+    # Environment flags computed once here and closed over by the hooks and
+    # handlers below, so nothing re-reads app.config on the request path
+    # (hooks and handlers must use these, not app.config.get(...))
+    debug_mode = bool(app.config.get('DEBUG'))
+    is_production = (config_name == 'production')
     
-    # Optional: Log which configuration is being used (helpful for debugging)
-    print(f"Starting application with '{config_name}' configuration")
+    # Apply the configured log level (e.g. WARNING in production) so the
+    # info-level messages below reduce to a cheap level check
+    if app.config.get('LOG_LEVEL'):
+        app.logger.setLevel(app.config['LOG_LEVEL'])
+    
+    # Log which configuration is being used (helpful for debugging)
+    app.logger.info("Starting application with '%s' configuration", config_name)
     
     
     # ========================================================================
@@ -106,17 +381,31 @@ def create_app(config_name=None):
     # Enables @jwt_required() decorator and token creation/validation
     jwt.init_app(app)
     
-    # Initialize CORS (Cross-Origin Resource Sharing)
-    # Allows frontend (React) running on different port to access API
-    cors.init_app(app, resources={
-        r"/api/*": {  # Apply CORS only to /api/* routes
-            "origins": app.config['CORS_ORIGINS'],  # Allowed origins from config
-            "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],  # Allowed HTTP methods
-            "allow_headers": ["Content-Type", "Authorization"],  # Allowed headers
-            "expose_headers": ["Content-Type", "Authorization"],  # Headers client can access
-            "supports_credentials": True  # Allow cookies/auth headers
-        }
-    })
+    # Initialize Cache (task GET response cache, see task_routes)
+    # Backend selected by CACHE_TYPE: Redis in deployments, in-process otherwise
+    cache.init_app(app)
+    
+    # CORS (Cross-Origin Resource Sharing)
+    # Allows frontend (React) running on different port to access API.
+    # Handled by the cors_after_request hook (STEP 9) for /api/* routes only;
+    # everything it needs is computed once here.
+    # Allowed origins from config (already a frozenset; frozenset() here is a
+    # no-op for it and still accepts a plain list set by tests/overrides)
+    cors_origins = frozenset(app.config['CORS_ORIGINS'])
+    cors_allow_any_origin = '*' in cors_origins
+    
+    # Added to every allowed cross-origin /api/* response
+    cors_headers = {
+        'Access-Control-Allow-Credentials': 'true',  # Allow cookies/auth headers
+        'Access-Control-Expose-Headers': 'Content-Type, Authorization'  # Headers client can access
+    }
+    
+    # Added to preflight (OPTIONS) responses
+    cors_preflight_headers = {
+        'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',  # Allowed HTTP methods
+        'Access-Control-Allow-Headers': 'Content-Type, Authorization',  # Allowed headers
+        'Access-Control-Max-Age': str(app.config.get('CORS_MAX_AGE', 86400))  # Cache preflight responses (seconds)
+    }
     
     
     # ========================================================================
@@ -125,7 +414,8 @@ def create_app(config_name=None):
     
     # Register API blueprint (contains all /api/tasks routes)
     # Blueprint prefix is /api, so routes become /api/tasks, /api/tasks/<id>, etc.
-    app.register_blueprint(api_bp)
+    if register_blueprints:
+        app.register_blueprint(_get_api_blueprint())
     
     # TODO: Register additional blueprints as they're created
     # from backend.src.api import auth_bp
@@ -136,19 +426,55 @@ def create_app(config_name=None):
     # STEP 5: Database Initialization
     # ========================================================================
     
-    # Create database tables if they don't exist
-    # Only in development - production should use migrations (Alembic/Flask-Migrate)
-    with app.app_context():
-        if config_name == 'development':
-            # db.create_all() creates tables based on model definitions
-            # Safe to call multiple times (won't recreate existing tables)
-            db.create_all()
-            print("Database tables created/verified")
-        
-        # In production, this should be handled by migrations:
-        # flask db init
-        # flask db migrate -m "Initial migration"
-        # flask db upgrade
+    # Schema creation is NOT done here. Running db.create_all() in the factory
+    # costs a round trip per table on every factory call (each Gunicorn worker
+    # boot, each test app), so it is explicit instead:
+    #
+    # Development / testing:
+    #     flask init-db
+    #     (or `with app.app_context(): db.create_all()` once per test session)
+    #
+    # Production should use migrations:
+    #     flask db init
+    #     flask db migrate -m "Initial migration"
+    #     flask db upgrade
+    
+    
+    # ========================================================================
+    # Precomputed JSON Response Bodies
+    # ========================================================================
+    
+    # The app-level routes and error handlers below always return
+    # the same payload for a given app (only `environment` varies, and that is
+    # fixed per app). Serialize each body once here instead of running jsonify
+    # on every call - /health in particular is hit every few seconds by probes.
+    # Error handlers return prebuilt (body, status, headers) tuples, so 404s
+    # from scanners don't even build a Response object themselves.
+    
+    # Route bodies are memoized per (route, environment) across factory calls
+    health_body = _canned_body('health', config_name)
+    index_body = _canned_body('index', config_name)
+    
+    not_found_response = _prebuilt_response({
+        'error': 'Resource not found',
+        'message': 'The requested URL was not found on the server'
+    }, 404)
+    
+    internal_error_response = _prebuilt_response({
+        'error': 'Internal server error',
+        'message': 'An unexpected error occurred. Please try again later.'
+        # In development, you might add: 'details': str(error)
+    }, 500)
+    
+    bad_request_response = _prebuilt_response({
+        'error': 'Bad request',
+        'message': 'The request could not be understood or was missing required parameters'
+    }, 400)
+    
+    method_not_allowed_response = _prebuilt_response({
+        'error': 'Method not allowed',
+        'message': 'The HTTP method is not allowed for this endpoint'
+    }, 405)
     
     
     # ========================================================================
@@ -176,10 +502,7 @@ def create_app(config_name=None):
                 "environment": "production"
             }
         """
-        return jsonify({
-            'status': 'healthy',
-            'environment': config_name
-        }), 200
+        return Response(health_body, 200, mimetype='application/json')
     
     
     @app.route('/')
@@ -204,16 +527,7 @@ def create_app(config_name=None):
                 }
             }
         """
-        return jsonify({
-            'message': 'Task Management API',
-            'version': '1.0.0',
-            'endpoints': {
-                'health': '/health',
-                'api': '/api',
-                'tasks': '/api/tasks',
-                'docs': '/api/docs'  # TODO: Add when API documentation is implemented
-            }
-        }), 200
+        return Response(index_body, 200, mimetype='application/json')
     
     
     # ========================================================================
@@ -235,10 +549,7 @@ def create_app(config_name=None):
         Returns:
             JSON error response with 404 status
         """
-        return jsonify({
-            'error': 'Resource not found',
-            'message': 'The requested URL was not found on the server'
-        }), 404
+        return not_found_response
     
     
     @app.errorhandler(500)
@@ -271,11 +582,7 @@ def create_app(config_name=None):
         # import logging
         # logging.error(f'Internal Server Error: {error}')
         
-        return jsonify({
-            'error': 'Internal server error',
-            'message': 'An unexpected error occurred. Please try again later.'
-            # In development, you might add: 'details': str(error)
-        }), 500
+        return internal_error_response
     
     
     @app.errorhandler(400)
@@ -294,10 +601,7 @@ def create_app(config_name=None):
         Returns:
             JSON error response with 400 status
         """
-        return jsonify({
-            'error': 'Bad request',
-            'message': 'The request could not be understood or was missing required parameters'
-        }), 400
+        return bad_request_response
     
     
     @app.errorhandler(405)
@@ -314,165 +618,84 @@ def create_app(config_name=None):
         Returns:
             JSON error response with 405 status
         """
-        return jsonify({
-            'error': 'Method not allowed',
-            'message': 'The HTTP method is not allowed for this endpoint'
-        }), 405
+        return method_not_allowed_response
     
     
     # ========================================================================
     # STEP 8: Register JWT Error Handlers
     # ========================================================================
     
-    @jwt.expired_token_loader
-    def expired_token_callback(jwt_header, jwt_payload):
-        """
-        Handle expired JWT tokens
-        
-        Triggered when user's JWT access token has expired
-        Client should request a new token using refresh token
-        
-        Args:
-            jwt_header: JWT header containing token metadata
-            jwt_payload: JWT payload containing user claims and expiration
-        
-        Returns:
-            JSON error response with 401 status
-        """
-        return jsonify({
-            'error': 'Token expired',
-            'message': 'The authentication token has expired. Please login again.'
-        }), 401
+    # The callbacks are module-level functions returning prebuilt bodies (see
+    # JWT Error Callbacks above), so the factory only wires references here
+    jwt.expired_token_loader(expired_token_callback)
+    jwt.invalid_token_loader(invalid_token_callback)
+    jwt.unauthorized_loader(missing_token_callback)
+    jwt.revoked_token_loader(revoked_token_callback)
+    jwt.needs_fresh_token_loader(token_not_fresh_callback)
     
     
-    @jwt.invalid_token_loader
-    def invalid_token_callback(error):
-        """
-        Handle invalid JWT tokens
-        
-        Triggered when:
-        - Token signature is invalid (tampered with)
-        - Token format is malformed
-        - Token algorithm doesn't match expected
-        - Token is corrupted
-        
-        Args:
-            error: Error message describing why token is invalid
-        
-        Returns:
-            JSON error response with 401 status
-        """
-        return jsonify({
-            'error': 'Invalid token',
-            'message': 'The authentication token is invalid. Please login again.'
-        }), 401
-    
+    # ========================================================================
+    # STEP 9: Register Request/Response Hooks
+    # ========================================================================
     
-    @jwt.unauthorized_loader
-    def missing_token_callback(error):
-        """
-        Handle missing JWT tokens
-        
-        Triggered when:
-        - No Authorization header is provided
-        - Authorization header doesn't start with 'Bearer '
-        - Endpoint requires JWT but none provided
-        - Token is empty or whitespace only
-        
-        Args:
-            error: Error message describing the authorization issue
-        
-        Returns:
-            JSON error response with 401 status
-        """
-        return jsonify({
-            'error': 'Authorization required',
-            'message': 'Request does not contain a valid authentication token. Please login.'
-        }), 401
+    # Request logging hook, only registered in debug mode. In production the
+    # hook list stays empty, so no Python code runs before each request.
+    if debug_mode:
+        @app.before_request
+        def before_request_func():
+            """
+            Execute before each request is processed (debug mode only)
+            
+            This runs BEFORE the route handler is called
+            Useful for:
+            - Request logging and monitoring
+            - Rate limiting checks
+            - Authentication preprocessing
+            - Request ID generation for tracing
+            - Database connection setup
+            
+            Note: This runs for EVERY request, so keep it lightweight
+            Avoid heavy computations or blocking operations here
+            """
+            # Log all incoming requests in development mode
+            app.logger.debug("%s %s", request.method, request.path)
     
     
-    @jwt.revoked_token_loader
-    def revoked_token_callback(jwt_header, jwt_payload):
+    @app.before_request
+    def cors_preflight():
         """
-        Handle revoked JWT tokens
-        
-        Triggered when:
-        - Token has been explicitly revoked (user logout, password change, etc.)
-        - Token is in revocation list/blacklist
+        Answer CORS preflight requests for /api/* before routing
         
-        Note: Requires token revocation implementation (Redis/database)
-        To use this, implement a token blocklist with Flask-JWT-Extended
-        
-        Args:
-            jwt_header: JWT header data
-            jwt_payload: JWT payload data (contains user_id, expiration, etc.)
+        Returning a response here skips URL dispatch and the view/JWT
+        machinery entirely; cors_after_request then adds the CORS headers
+        (or none, if the origin isn't allowed).
         
         Returns:
-            JSON error response with 401 status
+            Empty 204 response for OPTIONS /api/* requests, None otherwise
+            (None lets the request continue to the route handler)
         """
-        return jsonify({
-            'error': 'Token revoked',
-            'message': 'The authentication token has been revoked. Please login again.'
-        }), 401
+        if request.method == 'OPTIONS' and request.path.startswith('/api/'):
+            return app.response_class(status=204)
     
     
-    @jwt.needs_fresh_token_loader
-    def token_not_fresh_callback(jwt_header, jwt_payload):
-        """
-        Handle non-fresh tokens for sensitive operations
-        
-        Triggered when:
-        - Operation requires fresh token (recent login)
-        - User is using a token obtained via refresh (not original login)
-        - Sensitive operations require re-authentication
-        
-        Fresh tokens are issued on direct login
-        Non-fresh tokens are issued via refresh endpoint
-        
-        Use @jwt_required(fresh=True) for sensitive operations like:
-        - Changing password
-        - Updating email
-        - Deleting account
-        - Making payments
+    # Security headers added to every response (built once per app)
+    security_headers = {
+        # Prevents MIME type sniffing attacks
+        'X-Content-Type-Options': 'nosniff',
         
-        Args:
-            jwt_header: JWT header data
-            jwt_payload: JWT payload data
+        # Prevents clickjacking by disallowing iframe embedding
+        'X-Frame-Options': 'DENY',
         
-        Returns:
-            JSON error response with 401 status
-        """
-        return jsonify({
-            'error': 'Fresh token required',
-            'message': 'This operation requires a fresh authentication token. Please login again.'
-        }), 401
-    
-    
-    # ========================================================================
-    # STEP 9: Register Request/Response Hooks
-    # ========================================================================
-    
-    @app.before_request
-    def before_request_func():
-        """
-        Execute before each request is processed
+        # XSS protection (deprecated but still useful for older browsers)
+        'X-XSS-Protection': '1; mode=block',
         
-        This runs BEFORE the route handler is called
-        Useful for:
-        - Request logging and monitoring
-        - Rate limiting checks
-        - Authentication preprocessing
-        - Request ID generation for tracing
-        - Database connection setup
-        
-        Note: This runs for EVERY request, so keep it lightweight
-        Avoid heavy computations or blocking operations here
-        """
-        # Example: Log all incoming requests in development mode
-        if app.config.get('DEBUG'):
-            from flask import request
-            print(f"{request.method} {request.path}")
+        # Content Security Policy (basic, customize as needed)
+        # 'Content-Security-Policy': "default-src 'self'",
+    }
     
+    # Add HSTS header in production (forces HTTPS for 1 year)
+    if is_production:
+        security_headers['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains'
     
     @app.after_request
     def after_request_func(response):
@@ -485,7 +708,7 @@ def create_app(config_name=None):
         - Response logging
         - Response time tracking
         - Cache control headers
-        - CORS headers (handled by flask-cors, but can customize here)
+        - CORS headers (see cors_after_request)
         
         Args:
             response: Flask Response object that will be sent to client
@@ -493,54 +716,49 @@ def create_app(config_name=None):
         Returns:
             Modified Response object with additional headers
         """
-        # Add security headers to all responses
-        
-        # Prevents MIME type sniffing attacks
-        response.headers['X-Content-Type-Options'] = 'nosniff'
-        
-        # Prevents clickjacking by disallowing iframe embedding
-        response.headers['X-Frame-Options'] = 'DENY'
-        
-        # XSS protection (deprecated but still useful for older browsers)
-        response.headers['X-XSS-Protection'] = '1; mode=block'
-        
-        # Content Security Policy (basic, customize as needed)
-        # response.headers['Content-Security-Policy'] = "default-src 'self'"
-        
-        # Add HSTS header in production (forces HTTPS for 1 year)
-        if app.config.get('ENV') == 'production':
-            response.headers['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains'
-        
+        # Add security headers to all responses in one update
+        # (header set is built once per app, see security_headers above)
+        response.headers.update(security_headers)
         return response
     
     
-    @app.teardown_appcontext
-    def shutdown_session(exception=None):
+    @app.after_request
+    def cors_after_request(response):
         """
-        Clean up resources after request or when app context is torn down
+        Add CORS headers to /api/* responses for allowed origins
         
-        Automatically called at:
-        - End of each request
-        - When app context is popped/destroyed
-        - On application shutdown
-        
-        Ensures proper cleanup of:
-        - Database connections
-        - File handles
-        - Network connections
+        Specialized replacement for Flask-CORS: one prefix check, one O(1)
+        origin lookup and prebuilt header dicts, instead of matching every
+        request against a resources table.
         
         Args:
-            exception: Exception that caused teardown (None if normal completion)
-                      Can be used for error logging/cleanup
+            response: Flask Response object that will be sent to client
+        
+        Returns:
+            Response object with CORS headers when the origin is allowed
         """
-        # SQLAlchemy handles session cleanup automatically
-        # But explicit removal doesn't hurt and ensures proper cleanup
-        db.session.remove()
+        if not request.path.startswith('/api/'):
+            return response
+        
+        # The CORS headers depend on the Origin header, so caches must too
+        response.vary.add('Origin')
+        
+        origin = request.headers.get('Origin')
+        if origin and (cors_allow_any_origin or origin in cors_origins):
+            headers = response.headers
+            # Echo the origin back (required when credentials are allowed)
+            headers['Access-Control-Allow-Origin'] = origin
+            headers.update(cors_headers)
+            
+            if request.method == 'OPTIONS':
+                headers.update(cors_preflight_headers)
         
-        # If there was an exception, you might want to log it
-        # if exception:
-        #     import logging
-        #     logging.error(f'Request teardown with exception: {exception}')
+        return response
+    
+    
+    # No teardown_appcontext hook for the database session: db.init_app()
+    # already registers one that calls db.session.remove() at the end of every
+    # request/app context, so a second one here would only repeat that work.
     
     
     # ========================================================================
@@ -572,8 +790,43 @@ def create_app(config_name=None):
             db.create_all()
             print('Database initialized successfully')
             print('   All tables created based on model definitions')
-    
-    
+
+
+    @app.cli.command('upgrade-search')
+    def upgrade_search_command():
+        """
+        Add the task search column and indexes to an existing database
+
+        Usage:
+            flask upgrade-search
+
+        db.create_all() never alters tables that already exist, so databases
+        created before full-text search was added lack the generated
+        search_vector column and its GIN/trigram indexes. Until this runs,
+        /api/tasks/search detects the missing column and uses the ILIKE
+        substring match only: no relevance ranking, no word-prefix matches,
+        and a sequential scan. This runs the same idempotent statements that
+        init-db runs for new tables. Safe to run multiple times.
+        
+        Running app processes check for the column once, so restart them
+        afterwards to switch search over to full-text.
+        PostgreSQL only; other databases keep using ILIKE and need nothing.
+        """
+        from backend.src.models.task import TASK_SEARCH_DDL
+
+        with app.app_context():
+            if db.engine.dialect.name != 'postgresql':
+                print('Nothing to do: search indexes are PostgreSQL only')
+                return
+
+            # One transaction: either every statement applies or none does
+            for statement in TASK_SEARCH_DDL:
+                db.session.execute(text(statement))
+            db.session.commit()
+            print('Task search column and indexes are up to date')
+            print('   Restart running app processes to enable full-text search')
+
+
     @app.cli.command('seed-db')
     def seed_db_command():
         """
@@ -587,7 +840,9 @@ def create_app(config_name=None):
         
         Sample Data Created:
         - 2 users (admin, regular user)
-        - 2 sample tasks
+        - 3 sample tasks
+        
+        All rows are inserted in a single transaction.
         
         WARNING: Only use in development/testing environments
         """
@@ -623,12 +878,14 @@ def create_app(config_name=None):
             )
             user1.set_password('password123')
             
-            # Add users to session and commit
-            db.session.add(admin)
-            db.session.add(user1)
-            db.session.commit()
+            # Add users to session and flush (not commit) so the INSERTs run
+            # and admin.id / user1.id are populated for the tasks below,
+            # while everything is still committed in one transaction
+            users = [admin, user1]
+            db.session.add_all(users)
+            db.session.flush()
             
-            print(f'Created {User.query.count()} users:')
+            print(f'Created {len(users)} users:')
             print(f'   - admin (admin@example.com) - password: admin123')
             print(f'   - johndoe (john@example.com) - password: password123')
             
@@ -664,13 +921,13 @@ def create_app(config_name=None):
                 created_by=user1.id
             )
             
-            # Add tasks to session and commit
-            db.session.add(task1)
-            db.session.add(task2)
-            db.session.add(task3)
+            # Add tasks and commit users + tasks together
+            # (counts come from the lists, no extra COUNT(*) queries)
+            tasks = [task1, task2, task3]
+            db.session.add_all(tasks)
             db.session.commit()
             
-            print(f'Created {Task.query.count()} sample tasks')
+            print(f'Created {len(tasks)} sample tasks')
             print(' Database seeding complete!')
             print('You can now login with:')
             print('  Username: admin, Password: admin123')
@@ -689,7 +946,8 @@ def create_app(config_name=None):
         Use only in development/testing environments
         
         Steps:
-        1. Drops all existing tables
+        1. Drops all existing tables (PostgreSQL: drops and recreates the
+           public schema in a single statement)
         2. Recreates tables from model definitions
         3. Database is empty after this command
         
@@ -707,7 +965,14 @@ def create_app(config_name=None):
                 return
             
             # Drop all tables
-            db.drop_all()
+            if db.engine.dialect.name == 'postgresql':
+                # One server-side statement instead of a DROP TABLE per model
+                # (and no Python-side foreign key ordering)
+                db.session.execute(text('DROP SCHEMA public CASCADE; CREATE SCHEMA public;'))
+                db.session.commit()
+            else:
+                # SQLite and others: drop table by table from model metadata
+                db.drop_all()
             print('All tables dropped')
 
             # Recreate all tables
@@ -720,7 +985,7 @@ def create_app(config_name=None):
     # STEP 11: Return Configured Application
     # ========================================================================
     
-    print("Application factory complete - app ready to run")
+    app.logger.info("Application factory complete - app ready to run")
     return app
 
 
@@ -735,7 +1000,15 @@ if __name__ == '__main__':
     This block only executes when running the file directly (not when imported).
     Used for local development and testing.
     
-    Development Server Features:
+    First run: create the tables with `flask init-db` (the factory no longer
+    creates them automatically).
+    
+    Server Selection:
+    - Default: Waitress (pip install waitress) - multi-threaded WSGI server with
+      keep-alive, so local load testing of the API is representative
+    - python app.py --werkzeug, or Waitress not installed: Werkzeug dev server
+    
+    Werkzeug Dev Server Features (--werkzeug):
     - Auto-reload on code changes (use_reloader=True)
     - Debug mode with interactive debugger
     - Detailed error pages with stack traces
@@ -760,6 +1033,14 @@ if __name__ == '__main__':
             --threads=2 \
             "backend.app:create_app('production')"
         
+        # gevent workers (pip install gevent): requests are mostly waiting on
+        # PostgreSQL, so each worker multiplexes many connections instead of one
+        # request per thread. Gunicorn's gevent worker monkey-patches the stdlib
+        # before loading the app (don't patch in app code), and psycopg 3 yields
+        # to gevent on its own - no psycogreen needed. Size the DB pool to match:
+        DB_POOL_SIZE=50 FLASK_ENV=production gunicorn -k gevent -w $(nproc) \
+            --worker-connections 1000 -b 0.0.0.0:5000 "backend.app:create_app()"
+        
         # Using uwsgi
         uwsgi --http :5000 --wsgi-file backend/app.py --callable app
     """
@@ -767,25 +1048,40 @@ if __name__ == '__main__':
     # Create app with development configuration
     app = create_app('development')
     
-    # Run development server
-    app.run(
-        host='0.0.0.0',      # Listen on all network interfaces
-                             # 0.0.0.0 allows external access (useful for testing on mobile)
-                             # Use 127.0.0.1 to restrict to localhost only
-        
-        port=5000,           # Default Flask port
-                             # Change if port 5000 is already in use
-        
-        debug=True,          # Enable debug mode
-                             # - Detailed error pages with interactive debugger
-                             # - Auto-reload on code changes
-                             # - WARNING: Never use in production (security risk)
-        
-        use_reloader=True,   # Auto-reload when code changes
-                             # Watches Python files and restarts server on changes
-                             # Set to False if causing issues with debuggers
-        
-        threaded=True        # Handle multiple requests concurrently
-                             # Each request runs in a separate thread
-                             # Better performance for development testing
-    )
+    # Prefer Waitress unless the interactive debugger was explicitly requested
+    serve = None
+    if '--werkzeug' not in sys.argv:
+        try:
+            from waitress import serve
+        except ImportError:
+            pass
+    
+    if serve is not None:
+        # Waitress: fixed thread pool, connection keep-alive, no reloader
+        serve(app, host='0.0.0.0', port=5000, threads=8)
+    else:
+        # Werkzeug development server (debugger + auto-reload)
+        app.run(
+            host='0.0.0.0',      # Listen on all network interfaces
+                                 # 0.0.0.0 allows external access (useful for testing on mobile)
+                                 # Use 127.0.0.1 to restrict to localhost only
+        
+            port=5000,           # Default Flask port
+                                 # Change if port 5000 is already in use
+        
+            debug=True,          # Enable debug mode
+                                 # - Detailed error pages with interactive debugger
+                                 # - Auto-reload on code changes
+                                 # - WARNING: Never use in production (security risk)
+        
+            use_reloader=True,   # Auto-reload when code changes
+                                 # Watches Python files and restarts server on changes
+                                 # Set to False if causing issues with debuggers
+        
+            threaded=False,      # Handle one request at a time in one thread
+                                 # No per-request thread startup; the GIL would
+                                 # serialize CPU work anyway. Use Waitress or
+                                 # gunicorn for concurrent load testing
+            
+            processes=1          # Single process (required with the debugger)
+        )
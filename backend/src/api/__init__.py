@@ -2,8 +2,9 @@
 API Package Initialization Module
 
 This module creates the main API blueprint that serves as the entry point
-for all API routes in the application. All route modules are imported here
-and registered to the blueprint.
+for all API routes in the application. Route modules are imported by
+load_routes() (called by the app factory right before registering the
+blueprint), so importing this package alone stays cheap.
 
 Blueprint Pattern Benefits:
 - Modular route organization
@@ -13,19 +14,66 @@ Blueprint Pattern Benefits:
 """
 
 from flask import Blueprint
+from backend.src.services.exceptions import TaskNotFoundError
+from backend.src.utils.serialization import json_response
 
 # Create the main API blueprint with URL prefix '/api'
 # This means all routes registered to this blueprint will be prefixed with /api
 # Example: A route '/tasks' becomes '/api/tasks'
 api_bp = Blueprint('api', __name__, url_prefix='/api')
 
-# Import route modules to register them with the blueprint
-# The imports must come AFTER blueprint creation to avoid circular imports
-from backend.src.api import task_routes  # Task management endpoints
 
-# TODO: Uncomment when user routes are created
-# from backend.src.api import user_routes  # Authentication and user management endpoints
+# ============================================================================
+# Error Handlers (shared by every API route)
+# ============================================================================
+# Service-layer exceptions are turned into JSON responses here once, so the
+# views don't each need try/except blocks. Anything else propagates to the
+# app-level 500 handler (which rolls back the session and hides details).
+
+@api_bp.errorhandler(ValueError)
+def handle_value_error(error):
+    """Validation errors from validators or the service layer → 400"""
+    return json_response({'error': str(error)}, 400)
+
+
+@api_bp.errorhandler(TaskNotFoundError)
+def handle_task_not_found(error):
+    """
+    Task ID doesn't exist → 404.
+    
+    TaskNotFoundError is a ValueError; Flask picks the most specific
+    handler, so this one wins over handle_value_error.
+    """
+    return json_response({'error': str(error)}, 404)
+
+
+@api_bp.errorhandler(PermissionError)
+def handle_permission_error(error):
+    """User isn't allowed to modify the task → 403"""
+    return json_response({'error': str(error)}, 403)
+
+
+
+def load_routes() -> Blueprint:
+    """
+    Import all route modules so their views attach to api_bp.
+    
+    Route modules pull in the service layer, models and SQLAlchemy, so they
+    are imported here on demand instead of at package import time. Must run
+    before the blueprint is first registered (Flask rejects new routes on a
+    registered blueprint). Safe to call repeatedly - Python caches the imports.
+    
+    Returns:
+        Blueprint: api_bp with every route attached
+    """
+    from backend.src.api import task_routes  # noqa: F401  Task management endpoints
+    
+    # TODO: Uncomment when user routes are created
+    # from backend.src.api import user_routes  # Authentication and user management endpoints
+    
+    return api_bp
+
 
 # Export the blueprint so it can be imported by app.py
 # This allows the main Flask app to register all API routes at once
-__all__ = ['api_bp']
\ No newline at end of file
+__all__ = ['api_bp', 'load_routes']
@@ -21,17 +21,234 @@ All responses are JSON with consistent structure:
 HTTP Status Codes:
     200 - Success (GET, PUT, DELETE)
     201 - Created (POST)
+    304 - Not Modified (GET with a matching If-None-Match)
     400 - Bad Request (validation errors)
     401 - Unauthorized (missing/invalid JWT)
     403 - Forbidden (permission denied)
     404 - Not Found
     500 - Internal Server Error
+
+Error Handling:
+Views don't catch exceptions themselves. ValueError (400), TaskNotFoundError
+(404) and PermissionError (403) from the service layer are converted by the
+blueprint's error handlers in backend/src/api/__init__.py; anything else
+becomes the app's generic 500 response.
 """
 
-from flask import request, jsonify
+import hashlib
+import threading
+from collections import namedtuple
+from typing import Any, Iterator, Optional
+from cachelib import RedisCache
+from flask import Response, current_app, request, stream_with_context
 from flask_jwt_extended import jwt_required, get_jwt_identity
+from werkzeug.datastructures import MultiDict
 from backend.src.api import api_bp
-from backend.src.services.task_service import TaskService
+from backend.src.extensions import cache
+from backend.src.services.task_service import MIN_SEARCH_LENGTH, TaskService
+from backend.src.utils.serialization import dumps, json_response
+
+
+# ============================================================================
+# RESPONSE CACHE (read-through cache for GET endpoints)
+# ============================================================================
+# GET responses are cached as already-encoded JSON bytes, so a hit skips the
+# database round-trip, ORM materialization AND re-encoding.
+#
+# Keys embed a "generation" number. Every successful write bumps it, which
+# orphans all cached task responses at once (they then expire via TTL) -
+# cheaper and more reliable than tracking every page/filter combination that
+# a single task could appear in.
+#
+# Every cached GET response also carries an ETag (a digest of its body, stored
+# next to it). Clients that send If-None-Match with a matching tag get an
+# empty 304 - on a cache hit without touching the database or sending the body.
+
+_CACHE_GENERATION_KEY = 'tasks:generation'
+
+# Serializes generation bumps on in-process backends (SimpleCache), which have
+# no atomic increment that keeps the counter's no-expiry timeout
+_generation_lock = threading.Lock()
+
+# Largest streamed search body that is also kept for the response cache
+# (bytes); bigger results are streamed straight through and not cached
+MAX_CACHED_SEARCH_BYTES = 256 * 1024
+
+
+def _cache_key(user_id: Optional[Any] = None) -> str:
+    """
+    Build the cache key for the current GET request.
+    
+    Args:
+        user_id: Current user's ID when the response is user-scoped
+                 (my_tasks=true), None when it's the same for everyone
+    
+    Returns:
+        str: Key like 'tasks:<generation>:<user or all>:<path?query>'
+    """
+    generation = cache.get(_CACHE_GENERATION_KEY) or 0
+    scope = user_id if user_id is not None else 'all'
+    return f'tasks:{generation}:{scope}:{request.full_path}'
+
+
+def _etag(body: bytes) -> str:
+    """ETag value for a response body (128-bit BLAKE2b digest)"""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def _conditional_response(body: bytes, etag: str) -> Response:
+    """
+    Build a 200 JSON response with an ETag, or a 304 if the client has it.
+    
+    make_conditional() compares the tag against If-None-Match and, on a
+    match, turns the response into an empty 304 Not Modified.
+    """
+    response = current_app.response_class(body, status=200, mimetype='application/json')
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+
+def _cached_response(key: str) -> Optional[Response]:
+    """Return the cached 200 (or 304) response for key, or None on a miss"""
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    body, etag = entry
+    return _conditional_response(body, etag)
+
+
+def _cache_and_respond(key: str, payload: Any) -> Response:
+    """Encode payload once, store the bytes (and ETag) under key and respond"""
+    body = dumps(payload)
+    etag = _etag(body)
+    cache.set(key, (body, etag))
+    return _conditional_response(body, etag)
+
+
+def _invalidate_task_cache() -> None:
+    """Invalidate every cached task response (call after a successful write)"""
+    # timeout=0: the generation counter itself must never expire, otherwise
+    # it could restart at 0 and resurrect old keys. Seeded once; add() is a
+    # no-op while the counter exists
+    cache.add(_CACHE_GENERATION_KEY, 0, timeout=0)
+    
+    backend = cache.cache
+    if isinstance(backend, RedisCache):
+        # Atomic INCR: concurrent writes from any worker each get their own
+        # generation (and INCR keeps the key's no-expiry)
+        backend.inc(_CACHE_GENERATION_KEY)
+    else:
+        # cachelib's generic inc() re-sets the key with the default timeout,
+        # so bump it by hand under a lock (these backends are per-process)
+        with _generation_lock:
+            generation = cache.get(_CACHE_GENERATION_KEY) or 0
+            cache.set(_CACHE_GENERATION_KEY, generation + 1, timeout=0)
+
+
+def _stream_search_body(
+    cache_key: str,
+    search_term: str,
+    user_id: Optional[Any] = None
+) -> Iterator[bytes]:
+    """
+    Yield the search response JSON piece by piece, one chunk per task batch.
+    
+    Produces {"query": ..., "tasks": [...], "count": N}. Memory is bounded by
+    one task batch plus MAX_CACHED_SEARCH_BYTES: the encoded chunks are kept
+    for the response cache only while the body stays under that cap. Larger
+    results are streamed without being kept, and not cached.
+    
+    The query runs inside the generator: by the time the body is streamed,
+    the view's database session has been removed by app context teardown,
+    and stream_with_context provides a fresh one. Errors past this point
+    can no longer change the 200 status; they truncate the response.
+    """
+    head = b'{"query":' + dumps(search_term) + b',"tasks":['
+    chunks = [head]  # None once the body outgrows the cache cap
+    size = len(head)
+    yield head
+    
+    count = 0
+    for batch in TaskService.iter_search_results(search_term, user_id=user_id):
+        # dumps(list) gives "[a,b,...]": strip the brackets to splice it in
+        chunk = (b',' if count else b'') + dumps(batch)[1:-1]
+        count += len(batch)
+        if chunks is not None:
+            size += len(chunk)
+            if size > MAX_CACHED_SEARCH_BYTES:
+                chunks = None  # Too big to cache: stop keeping chunks
+            else:
+                chunks.append(chunk)
+        yield chunk
+    
+    tail = b'],"count":' + str(count).encode('ascii') + b'}'
+    yield tail
+    
+    # Cached like the other GET responses, so repeat searches get an ETag too
+    if chunks is not None:
+        chunks.append(tail)
+        body = b''.join(chunks)
+        cache.set(cache_key, (body, _etag(body)))
+
+
+# ============================================================================
+# QUERY PARAMETER PARSING
+# ============================================================================
+
+# Parsed GET /tasks query parameters (see get_tasks for their meaning)
+TaskListArgs = namedtuple(
+    'TaskListArgs', 'status priority category assigned_to page per_page cursor include_total'
+)
+
+
+def _int_arg(value: Optional[str], default: Optional[int] = None) -> Optional[int]:
+    """Convert a query parameter to int, falling back to default like args.get(type=int)"""
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+
+def _parse_list_args(query_args: MultiDict) -> TaskListArgs:
+    """
+    Parse the GET /tasks filter and pagination parameters.
+    
+    Converts the MultiDict to a plain dict once (first value per key) instead
+    of going through MultiDict.get() with type conversion for every parameter.
+    
+    Args:
+        query_args: request.args
+        
+    Returns:
+        TaskListArgs: Filters (None if not given) and pagination values
+    """
+    raw = query_args.to_dict()
+    
+    # Pagination defaults from the app's frozen config (see config.freeze)
+    settings = current_app.extensions['frozen_config']
+    
+    page = _int_arg(raw.get('page'), 1)                                   # Default to page 1
+    per_page = _int_arg(raw.get('per_page'), settings['ITEMS_PER_PAGE'])  # Default to 20 items
+    
+    # Cursor pagination: ?cursor=<next_cursor> (only when page is not given)
+    cursor = raw.get('cursor')
+    if cursor is not None and 'page' not in raw:
+        page = None
+    
+    return TaskListArgs(
+        status=raw.get('status'),           # e.g., ?status=pending
+        priority=raw.get('priority'),       # e.g., ?priority=high
+        category=raw.get('category'),       # e.g., ?category=Work
+        assigned_to=_int_arg(raw.get('assigned_to')),
+        page=page,
+        # Security: Cap per_page (100) to prevent abuse/performance issues
+        per_page=min(per_page, settings['MAX_ITEMS_PER_PAGE']),
+        cursor=cursor,
+        # Counting every match is opt-in: ?include_total=true
+        include_total=raw.get('include_total', 'false').lower() == 'true'
+    )
 
 
 # ============================================================================
@@ -94,42 +311,31 @@ def create_task():
         404 - Assigned user not found
         500 - Server error
     """
-    try:
-        # Extract the authenticated user's ID from the JWT token payload
-        # This was set during login and is cryptographically verified
-        current_user_id = get_jwt_identity()
-        
-        # Parse JSON data from request body
-        # Returns None if body is empty or not valid JSON
-        data = request.get_json()
-        
-        # Validate that request body contains data
-        if not data:
-            return jsonify({'error': 'No data provided'}), 400
-        
-        # Delegate task creation to service layer
-        # Service handles validation, database operations, and business logic
-        task = TaskService.create_task(data, created_by_id=current_user_id)
-        
-        # Return success response with 201 Created status
-        # to_dict() converts SQLAlchemy model to JSON-serializable dictionary
-        return jsonify({
-            'message': 'Task created successfully',
-            'task': task.to_dict()
-        }), 201
-        
-    except ValueError as e:
-        # Validation errors from validators or service layer
-        # Examples: empty title, invalid status, user not found
-        return jsonify({'error': str(e)}), 400
-    
-    except Exception as e:
-        # Catch-all for unexpected errors (database connection, etc.)
-        # In production, log this error to monitoring system
-        return jsonify({
-            'error': 'Internal server error',
-            'details': str(e)
-        }), 500
+    # Extract the authenticated user's ID from the JWT token payload
+    # This was set during login and is cryptographically verified
+    current_user_id = get_jwt_identity()
+    
+    # Parse JSON data from request body
+    # Returns None if body is empty or not valid JSON
+    data = request.get_json()
+    
+    # Validate that request body contains data
+    if not data:
+        return json_response({'error': 'No data provided'}, 400)
+    
+    # Delegate task creation to service layer
+    # Service handles validation, database operations, and business logic
+    task = TaskService.create_task(data, created_by_id=current_user_id)
+    
+    # Cached lists/searches may now be missing this task
+    _invalidate_task_cache()
+    
+    # Return success response with 201 Created status
+    # to_dict() converts SQLAlchemy model to JSON-serializable dictionary
+    return json_response({
+        'message': 'Task created successfully',
+        'task': task.to_dict()
+    }, 201)
 
 
 # ============================================================================
@@ -152,13 +358,20 @@ def get_tasks():
         my_tasks     - If 'true', show only current user's tasks (created by OR assigned to)
         page         - Page number (default: 1, 1-indexed)
         per_page     - Items per page (default: 20, max: 100)
+        cursor       - Cursor pagination: 'next_cursor' from the previous response.
+                       Used instead of page (ignored if page is given); much
+                       faster than page for deep pages
+        include_total - If 'true', also return 'total' and 'pages' (page mode;
+                       counting every matching task costs extra database work)
     
     Example Requests:
         GET /api/tasks                              → All tasks, page 1
         GET /api/tasks?status=pending               → Only pending tasks
+        GET /api/tasks?include_total=true           → Page 1 plus total/pages
         GET /api/tasks?my_tasks=true                → Only my tasks
         GET /api/tasks?priority=high&page=2         → High priority tasks, page 2
         GET /api/tasks?assigned_to=5&per_page=50    → Tasks assigned to user 5, 50 per page
+        GET /api/tasks?cursor=WyIyMDI0LTEy...       → Page following the one that returned this cursor
     
     Success Response (200):
         {
@@ -176,66 +389,71 @@ def get_tasks():
                     // ... full task object
                 }
             ],
-            "total": 45,        # Total number of matching tasks (all pages)
             "page": 1,          # Current page number
             "per_page": 20,     # Items per page
-            "pages": 3          # Total number of pages
+            "has_next": true,   # Whether another page follows
+            "next_cursor": "...", # Pass as ?cursor= for the next page; null on the last page
+            "total": 45,        # Only with include_total=true: matching tasks (all pages)
+            "pages": 3          # Only with include_total=true: total number of pages
         }
     
+    Breaking change: 'total' and 'pages' used to be in every page response.
+    They are now only returned with include_total=true; clients that relied
+    on them must pass it, or page with has_next/next_cursor instead.
+    
+    Cursor Response (200, when ?cursor= is used):
+        {
+            "tasks": [ ... ],
+            "per_page": 20,
+            "next_cursor": "..." # Pass as ?cursor= for the next page; null on the last page
+        }
+    
+    Conditional Requests:
+        Responses carry an ETag header. Send it back as If-None-Match to get
+        an empty 304 Not Modified while the response is unchanged.
+    
     Error Responses:
+        400 - Invalid pagination cursor
         401 - Missing or invalid JWT token
         500 - Server error
     """
-    try:
-        # Get authenticated user ID from JWT
-        current_user_id = get_jwt_identity()
-        
-        # Extract and parse query parameters from URL
-        # request.args is a MultiDict of query string parameters
-        
-        # Filter parameters (optional, None if not provided)
-        status = request.args.get('status')          # e.g., ?status=pending
-        priority = request.args.get('priority')      # e.g., ?priority=high
-        category = request.args.get('category')      # e.g., ?category=Work
-        assigned_to = request.args.get('assigned_to', type=int)  # Auto-convert to int
-        
-        # Special filter: show only current user's tasks
-        # Convert string 'true'/'false' to boolean
-        my_tasks = request.args.get('my_tasks', 'false').lower() == 'true'
-        
-        # Pagination parameters with defaults and type conversion
-        page = request.args.get('page', 1, type=int)           # Default to page 1
-        per_page = request.args.get('per_page', 20, type=int)  # Default to 20 items
-        
-        # Security: Cap per_page at 100 to prevent abuse/performance issues
-        # min() ensures we never exceed 100 items per page
-        per_page = min(per_page, 100)
-        
-        # Determine user filter based on my_tasks parameter
-        # If my_tasks=true, filter by current user; otherwise show all tasks
-        user_filter = current_user_id if my_tasks else None
-        
-        # Delegate to service layer for business logic and database query
-        # Service handles complex filtering, sorting, and pagination
-        result = TaskService.get_all_tasks(
-            user_id=user_filter,
-            status=status,
-            priority=priority,
-            category=category,
-            assigned_to=assigned_to,
-            page=page,
-            per_page=per_page
-        )
-        
-        # Return paginated results with metadata
-        return jsonify(result), 200
-        
-    except Exception as e:
-        # Handle unexpected errors
-        return jsonify({
-            'error': 'Internal server error',
-            'details': str(e)
-        }), 500
+    # Get authenticated user ID from JWT
+    current_user_id = get_jwt_identity()
+    
+    # Special filter: show only current user's tasks
+    # Only this parameter affects the cache key, so it's checked first
+    my_tasks = request.args.get('my_tasks', 'false').lower() == 'true'
+    
+    # Determine user filter based on my_tasks parameter
+    # If my_tasks=true, filter by current user; otherwise show all tasks
+    user_filter = current_user_id if my_tasks else None
+    
+    # Serve from cache when this exact query was answered recently
+    # (before parsing the remaining parameters - a hit doesn't need them)
+    cache_key = _cache_key(user_filter)
+    cached = _cached_response(cache_key)
+    if cached is not None:
+        return cached
+    
+    # Extract and parse the remaining query parameters in one pass
+    args = _parse_list_args(request.args)
+    
+    # Delegate to service layer for business logic and database query
+    # Service handles complex filtering, sorting, and pagination
+    result = TaskService.get_all_tasks(
+        user_id=user_filter,
+        status=args.status,
+        priority=args.priority,
+        category=args.category,
+        assigned_to=args.assigned_to,
+        page=args.page,
+        per_page=args.per_page,
+        cursor=args.cursor,
+        include_total=args.include_total
+    )
+    
+    # Return paginated results with metadata (and cache the encoded body)
+    return _cache_and_respond(cache_key, result)
 
 
 # ============================================================================
@@ -283,33 +501,35 @@ def get_task(task_id):
             }
         }
     
+    Conditional Requests:
+        Responses carry an ETag header. Send it back as If-None-Match to get
+        an empty 304 Not Modified while the response is unchanged.
+    
     Error Responses:
         401 - Missing or invalid JWT token
         404 - Task not found (invalid task_id)
         500 - Server error
     """
-    try:
-        # Retrieve task from database using service layer
-        # Returns Task object or None if not found
-        task = TaskService.get_task_by_id(task_id)
-        
-        # Handle case where task doesn't exist
-        if not task:
-            return jsonify({
-                'error': f'Task with ID {task_id} not found'
-            }), 404
-        
-        # Return task data
-        # Note: No permission check here - any authenticated user can view tasks
-        # Add permission check here if you want private tasks
-        return jsonify({'task': task.to_dict()}), 200
-        
-    except Exception as e:
-        # Handle unexpected errors
-        return jsonify({
-            'error': 'Internal server error',
-            'details': str(e)
-        }), 500
+    # Serve from cache when this task was fetched recently
+    cache_key = _cache_key()
+    cached = _cached_response(cache_key)
+    if cached is not None:
+        return cached
+    
+    # Retrieve task using service layer (shared task cache, then database)
+    # Returns the task dictionary or None if not found
+    task = TaskService.get_task_dict(task_id)
+    
+    # Handle case where task doesn't exist
+    if not task:
+        return json_response({
+            'error': f'Task with ID {task_id} not found'
+        }, 404)
+    
+    # Return task data
+    # Note: No permission check here - any authenticated user can view tasks
+    # Add permission check here if you want private tasks
+    return _cache_and_respond(cache_key, {'task': task})
 
 
 # ============================================================================
@@ -362,45 +582,32 @@ def update_task(task_id):
         404 - Task not found
         500 - Server error
     """
-    try:
-        # Get authenticated user ID
-        current_user_id = get_jwt_identity()
-        
-        # Parse update data from request body
-        data = request.get_json()
-        
-        # Validate that request contains data
-        if not data:
-            return jsonify({'error': 'No data provided'}), 400
-        
-        # Delegate to service layer
-        # Service will:
-        # 1. Verify task exists
-        # 2. Check user has permission to update
-        # 3. Validate update data
-        # 4. Apply updates to database
-        task = TaskService.update_task(task_id, data, user_id=current_user_id)
-        
-        # Return updated task
-        return jsonify({
-            'message': 'Task updated successfully',
-            'task': task.to_dict()
-        }), 200
-        
-    except ValueError as e:
-        # Validation errors or task not found
-        return jsonify({'error': str(e)}), 400
-    
-    except PermissionError as e:
-        # User doesn't have permission to update this task
-        return jsonify({'error': str(e)}), 403
-    
-    except Exception as e:
-        # Unexpected errors
-        return jsonify({
-            'error': 'Internal server error',
-            'details': str(e)
-        }), 500
+    # Get authenticated user ID
+    current_user_id = get_jwt_identity()
+    
+    # Parse update data from request body
+    data = request.get_json()
+    
+    # Validate that request contains data
+    if not data:
+        return json_response({'error': 'No data provided'}, 400)
+    
+    # Delegate to service layer
+    # Service will:
+    # 1. Verify task exists
+    # 2. Check user has permission to update
+    # 3. Validate update data
+    # 4. Apply updates to database
+    task = TaskService.update_task(task_id, data, user_id=current_user_id)
+    
+    # Cached copies of this task (single, lists, searches) are now stale
+    _invalidate_task_cache()
+    
+    # Return updated task
+    return json_response({
+        'message': 'Task updated successfully',
+        'task': task.to_dict()
+    }, 200)
 
 
 # ============================================================================
@@ -440,36 +647,23 @@ def delete_task(task_id):
         Consider implementing soft delete (is_deleted flag) for production systems
         to allow data recovery and maintain audit trails.
     """
-    try:
-        # Get authenticated user ID
-        current_user_id = get_jwt_identity()
-        
-        # Delegate to service layer
-        # Service will:
-        # 1. Verify task exists
-        # 2. Check user is the creator (not just assignee)
-        # 3. Permanently delete from database
-        TaskService.delete_task(task_id, user_id=current_user_id)
-        
-        # Return success message
-        return jsonify({
-            'message': f'Task {task_id} deleted successfully'
-        }), 200
-        
-    except ValueError as e:
-        # Task not found
-        return jsonify({'error': str(e)}), 404
-    
-    except PermissionError as e:
-        # User is not the task creator
-        return jsonify({'error': str(e)}), 403
-    
-    except Exception as e:
-        # Unexpected errors (database issues, etc.)
-        return jsonify({
-            'error': 'Internal server error',
-            'details': str(e)
-        }), 500
+    # Get authenticated user ID
+    current_user_id = get_jwt_identity()
+    
+    # Delegate to service layer
+    # Service will:
+    # 1. Verify task exists
+    # 2. Check user is the creator (not just assignee)
+    # 3. Permanently delete from database
+    TaskService.delete_task(task_id, user_id=current_user_id)
+    
+    # Drop cached responses that still include the deleted task
+    _invalidate_task_cache()
+    
+    # Return success message
+    return json_response({
+        'message': f'Task {task_id} deleted successfully'
+    }, 200)
 
 
 # ============================================================================
@@ -489,10 +683,14 @@ def search_tasks():
         my_tasks  - Limit search to user's tasks (optional, default: false)
     
     Search Behavior:
+        - Query must be at least 3 characters
         - Case-insensitive search
         - Searches both title AND description fields
         - Partial matching (e.g., "doc" matches "documentation")
-        - Results ordered by creation date (newest first)
+        - PostgreSQL: substring match (trigram GIN indexes) plus full-text
+          search (all words as word prefixes); results ordered by relevance,
+          then newest first
+        - Other databases: substring match, ordered by creation date (newest first)
     
     Example Requests:
         GET /api/tasks/search?q=documentation
@@ -501,7 +699,6 @@ def search_tasks():
     Success Response (200):
         {
             "query": "documentation",    # Echo back the search term
-            "count": 3,                  # Number of matching tasks
             "tasks": [
                 {
                     "id": 1,
@@ -521,45 +718,54 @@ def search_tasks():
                     "description": "Add documentation for new features",
                     // ... full task object
                 }
-            ]
+            ],
+            "count": 3                   # Number of matching tasks
         }
     
+    The response is streamed in batches, so "count" comes last. Results
+    larger than MAX_CACHED_SEARCH_BYTES are not cached (and carry no ETag).
+    
     Error Responses:
-        400 - Missing search query parameter
+        400 - Missing or too short search query parameter
         401 - Missing or invalid JWT token
         500 - Server error
     """
-    try:
-        # Extract search query from URL parameters
-        # .strip() removes leading/trailing whitespace
-        search_term = request.args.get('q', '').strip()
-        
-        # Validate that search term was provided
-        if not search_term:
-            return jsonify({
-                'error': 'Search query (q) is required'
-            }), 400
-        
-        # Check if limiting search to current user's tasks
-        my_tasks = request.args.get('my_tasks', 'false').lower() == 'true'
-        
-        # Get user ID only if my_tasks=true, otherwise None (search all tasks)
-        current_user_id = get_jwt_identity() if my_tasks else None
-        
-        # Perform search via service layer
-        # Service handles database query with ILIKE for case-insensitive matching
-        tasks = TaskService.search_tasks(search_term, user_id=current_user_id)
-        
-        # Return search results with metadata
-        return jsonify({
-            'query': search_term,           # Echo search term for client reference
-            'count': len(tasks),            # Number of results found
-            'tasks': [task.to_dict() for task in tasks]  # Full task objects
-        }), 200
-        
-    except Exception as e:
-        # Handle unexpected errors
-        return jsonify({
-            'error': 'Internal server error',
-            'details': str(e)
-        }), 500
\ No newline at end of file
+    # Extract search query from URL parameters
+    # .strip() removes leading/trailing whitespace
+    search_term = request.args.get('q', '').strip()
+    
+    # Validate that search term was provided
+    if not search_term:
+        return json_response({
+            'error': 'Search query (q) is required'
+        }, 400)
+    
+    # Very short terms match almost every row and can't use the trigram
+    # indexes (they need 3+ characters), so reject them before any DB work
+    if len(search_term) < MIN_SEARCH_LENGTH:
+        return json_response({
+            'error': f'Search query (q) must be at least {MIN_SEARCH_LENGTH} characters'
+        }, 400)
+    
+    # Check if limiting search to current user's tasks
+    my_tasks = request.args.get('my_tasks', 'false').lower() == 'true'
+    
+    # Get user ID only if my_tasks=true, otherwise None (search all tasks)
+    current_user_id = get_jwt_identity() if my_tasks else None
+    
+    # Serve from cache when this exact search ran recently
+    cache_key = _cache_key(current_user_id)
+    cached = _cached_response(cache_key)
+    if cached is not None:
+        return cached
+    
+    # Perform search via service layer
+    # Service uses full-text search on PostgreSQL, ILIKE elsewhere.
+    # Results are streamed in serialized batches (the count is only known
+    # at the end, so it comes after the tasks); bodies up to
+    # MAX_CACHED_SEARCH_BYTES are cached once sent
+    return current_app.response_class(
+        stream_with_context(_stream_search_body(cache_key, search_term, current_user_id)),
+        status=200,
+        mimetype='application/json'
+    )
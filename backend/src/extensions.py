@@ -5,15 +5,20 @@ This pattern allows extensions to be imported by models before app creation.
 """
 
 from flask_sqlalchemy import SQLAlchemy
-from flask_jwt_extended import JWTManager
-from flask_cors import CORS
+from flask_caching import Cache
+from backend.src.utils.token_cache import CachingJWTManager
 
 # Initialize SQLAlchemy (database ORM)
 # Will be bound to Flask app with db.init_app(app)
 db = SQLAlchemy()
 
 # Initialize JWT Manager (for authentication tokens)
-jwt = JWTManager()
+# Caches verified tokens so repeat requests with the same token skip decoding
+jwt = CachingJWTManager()
 
-# Initialize CORS (Cross-Origin Resource Sharing for frontend)
-cors = CORS()
\ No newline at end of file
+# Initialize Cache (read-through cache for task GET responses)
+# Backend comes from config: Redis when REDIS_URL is set, in-process otherwise
+cache = Cache()
+
+# CORS is not an extension here: create_app adds the headers itself with a
+# small after_request hook specialized for the /api/* routes
\ No newline at end of file
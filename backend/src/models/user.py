@@ -1,11 +1,25 @@
 """
 Purpose: User model for authentication and task assignment.
-Depends on: SQLALchemy, werkzeug.security
+Depends on: SQLALchemy, werkzeug.security, cache (password check results)
 Used by: Auth API, Task management API
 """
+import hashlib
+import hmac
 from datetime import datetime
+from flask import current_app
 from werkzeug.security import generate_password_hash, check_password_hash
-from backend.src.extensions import db
+from backend.src.extensions import db, cache
+
+# How long a successful password check is remembered (seconds). Short, so a
+# disabled account or leaked cache entry stops mattering quickly.
+PASSWORD_CHECK_CACHE_TIMEOUT = 60
+
+# Prefixes of the hash formats werkzeug's generate_password_hash produces
+_PASSWORD_HASH_PREFIXES = ('scrypt:', 'pbkdf2:')
+
+# Valid hash checked in place of a missing/malformed one. Built once at import,
+# so no check (not even the first in a process) pays for hashing it
+_DUMMY_PASSWORD_HASH = generate_password_hash('x' * 16)
 
 
 class User(db.Model):
@@ -16,7 +30,7 @@ class User(db.Model):
         - id: Primary key
         - username: Unique username for login
         - email: Unique email address
-        - password_hash: Bcrypt hashed password (never store plain passwords)
+        - password_hash: Salted scrypt/pbkdf2 hash (never store plain passwords)
         - first_name: User's first name
         - last_name: User's last name
         - is_active: Whether account is active
@@ -64,25 +78,56 @@ class User(db.Model):
     
     def set_password(self, password):
         """
-        Hash and store password securely using bcrypt.
+        Hash and store password securely using werkzeug's salted scrypt hash.
         
         Args:
             password (str): Plain text password from user input
         """
-        # generate_password_hash uses bcrypt with salt
+        # generate_password_hash salts and hashes with werkzeug's default
+        # method (scrypt; older hashes may be pbkdf2)
         self.password_hash = generate_password_hash(password)
     
     def check_password(self, password):
         """
         Verify password against stored hash.
         
+        Successful checks are remembered for PASSWORD_CHECK_CACHE_TIMEOUT
+        seconds, so repeated logins skip the deliberately slow hash. The cache
+        key is an HMAC (keyed with SECRET_KEY) over the user ID, the stored
+        hash and the candidate password: nothing in the cache reveals the
+        password, and set_password() changes the hash, which retires every
+        old entry. Failed checks are never cached.
+        
+        A missing or malformed stored hash can never match. It is answered
+        with a check against a dummy hash, so it takes as long as a real
+        failed check (werkzeug would otherwise return at once, or raise on
+        None) and doesn't reveal which accounts have a broken hash.
+        
         Args:
             password (str): Plain text password to verify
             
         Returns:
             bool: True if password matches, False otherwise
         """
-        return check_password_hash(self.password_hash, password)
+        if not self.password_hash or not self.password_hash.startswith(_PASSWORD_HASH_PREFIXES):
+            check_password_hash(_DUMMY_PASSWORD_HASH, password)
+            return False
+        
+        digest = hmac.new(
+            current_app.config['SECRET_KEY'].encode('utf-8'),
+            f'{self.id}:{self.password_hash}:{password}'.encode('utf-8'),
+            hashlib.sha256
+        ).hexdigest()
+        cache_key = f'pwcheck:{digest}'
+        
+        if cache.get(cache_key):
+            return True
+        
+        if not check_password_hash(self.password_hash, password):
+            return False
+        
+        cache.set(cache_key, True, timeout=PASSWORD_CHECK_CACHE_TIMEOUT)
+        return True
     
     def to_dict(self, include_email=False):
         """
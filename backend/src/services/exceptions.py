@@ -0,0 +1,9 @@
+"""
+Purpose: Exceptions raised by the service layer
+Depends on: Nothing (safe to import anywhere, e.g. the API package's error handlers)
+Used by: TaskService, API error handlers
+"""
+
+
+class TaskNotFoundError(ValueError):
+    """Raised when a task ID doesn't exist (the API answers 404)"""
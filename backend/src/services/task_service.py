@@ -1,22 +1,185 @@
 """
 Purpose: Business logic for task operations (CRUD)
-Depends on: Task model, validators, db
+Depends on: Task model, validators, db, cache, UserCache
 Used by: API routes
 Task Service Layer - Contains all business logic for task operations.
 Separates business rules from API routes for better testability and reusability.
 """
 
-from typing import List, Dict, Any, Optional
-from sqlalchemy import or_, and_
-from backend.src.models.task import Task
-from backend.src.models.user import User
-from backend.src.extensions import db
+import base64
+import json
+import math
+import re
+import weakref
+from datetime import datetime
+from itertools import islice
+from typing import Iterator, List, Dict, Any, Optional, Tuple
+from flask import current_app
+from sqlalchemy import or_, and_, func, tuple_, update, delete, exists, inspect
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload, raiseload
+from backend.src.models.task import Task, task_search_vector
+from backend.src.extensions import db, cache
+from backend.src.services.exceptions import TaskNotFoundError
+from backend.src.services.user_cache import UserCache
 from backend.src.utils.validators import validate_task_data
 
 
+# Shortest search term that is run at all: shorter terms match almost every
+# row and can't use the pg_trgm indexes (trigrams need 3 characters)
+MIN_SEARCH_LENGTH = 3
+
+# How long a single task's serialized columns stay in the shared cache
+# (seconds). update_task/delete_task refresh or drop the entry right away
+TASK_CACHE_TIMEOUT = 300
+
+# Words usable in a PostgreSQL tsquery (drops tsquery operators and punctuation)
+_SEARCH_WORD_RE = re.compile(r'\w+')
+
+# Whether each engine's tasks table has the generated search_vector column
+# (checked once per engine; see _has_search_vector)
+_search_vector_available: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+
+def _prefix_tsquery(search_term: str):
+    """
+    to_tsquery() expression matching every word of search_term as a prefix.
+    
+    "api doc" becomes to_tsquery('english', 'api:* & doc:*'). Only \w+ runs
+    are kept, so tsquery operators and punctuation in the term can't cause a
+    syntax error.
+    
+    Returns:
+        The SQL expression, or None if the term has no words
+    """
+    words = _SEARCH_WORD_RE.findall(search_term)
+    if not words:
+        return None
+    return func.to_tsquery('english', ' & '.join(f'{word}:*' for word in words))
+
+
+def _has_search_vector(engine) -> bool:
+    """
+    Whether full-text search can run on this engine's tasks table.
+    
+    True only on PostgreSQL when the unmapped search_vector column exists:
+    db.create_all() adds it to new tables, but databases created before
+    search was added lack it until `flask upgrade-search` runs (searching
+    them falls back to the substring match instead of failing). The answer
+    is cached per engine, so restart the app after upgrading.
+    """
+    available = _search_vector_available.get(engine)
+    if available is None:
+        available = engine.dialect.name == 'postgresql' and any(
+            column['name'] == 'search_vector'
+            for column in inspect(engine).get_columns('tasks')
+        )
+        _search_vector_available[engine] = available
+        if not available and engine.dialect.name == 'postgresql':
+            current_app.logger.warning(
+                "tasks.search_vector is missing: search uses ILIKE only "
+                "until `flask upgrade-search` is run"
+            )
+    return available
+
+
+def _encode_cursor(task: Task) -> str:
+    """
+    Opaque pagination cursor for the row after which the next page starts.
+    
+    URL-safe base64 of the task's sort keys as JSON: [due_date, created_at, id].
+    """
+    due_date = task.due_date.isoformat() if task.due_date else None
+    payload = json.dumps([due_date, task.created_at.isoformat(), task.id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def _decode_cursor(cursor: str) -> Tuple[Optional[datetime], datetime, int]:
+    """
+    Decode a cursor made by _encode_cursor.
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        due_date, created_at, task_id = json.loads(base64.urlsafe_b64decode(padded))
+        return (
+            datetime.fromisoformat(due_date) if due_date is not None else None,
+            datetime.fromisoformat(created_at),
+            int(task_id)
+        )
+    except (ValueError, TypeError):  # Bad base64/JSON/shape/dates (binascii.Error is a ValueError)
+        raise ValueError("Invalid pagination cursor") from None
+
+
+def _after_cursor(due_date: Optional[datetime], created_at: datetime, task_id: int):
+    """
+    WHERE condition for rows sorting after the cursor row in the list order
+    (due_date ASC NULLS LAST, created_at DESC, id DESC).
+    
+    The directions are mixed, so it can't be a single row-value comparison:
+    (created_at, id) descend together, due_date ascends with NULLs last.
+    """
+    # Same due date: continue with older tasks, then lower IDs
+    same_due_date_tail = tuple_(Task.created_at, Task.id) < tuple_(created_at, task_id)
+    
+    if due_date is None:
+        # Cursor is already in the trailing NULL block
+        return and_(Task.due_date.is_(None), same_due_date_tail)
+    
+    return or_(
+        Task.due_date > due_date,
+        Task.due_date.is_(None),
+        and_(Task.due_date == due_date, same_due_date_tail)
+    )
+
+
 class TaskService:
     """Service class for task-related business operations"""
     
+    # Query options for list endpoints: no relationship is loaded - users are
+    # batch-loaded by serialize_tasks in at most ONE query (tasks + 1 IN lookup
+    # per page for users not already in UserCache, fewer than selectinload's
+    # one query per relationship). raiseload('*') also covers relationships
+    # added to Task later, so a serializer that starts touching one fails
+    # loudly instead of issuing a query per row
+    _LIST_OPTIONS = (raiseload('*'),)
+    
+    # Query options for single-task reads: both users in the same SELECT
+    _DETAIL_OPTIONS = (joinedload(Task.assignee), joinedload(Task.creator))
+    
+    # Fields a client may change through update_task. Explicit allow-list:
+    # id, created_by and the timestamps are never client-writable
+    _TASK_UPDATABLE = frozenset({
+        'title', 'description', 'status', 'priority', 'category', 'due_date', 'assigned_to'
+    })
+    
+    @staticmethod
+    def serialize_tasks(tasks: List[Task]) -> List[Dict[str, Any]]:
+        """
+        Serialize a list of tasks with one batched users query.
+        
+        Collects the distinct creator/assignee IDs and resolves them through
+        UserCache: users already in the shared cache cost no query, and the rest
+        are loaded (only the columns the API exposes) in a single
+        SELECT ... WHERE id IN (...). This avoids joining the full user row twice
+        onto every task row.
+        
+        Args:
+            tasks: Task objects (typically loaded with _LIST_OPTIONS)
+            
+        Returns:
+            list: Task dictionaries in the same order as the input
+        """
+        if not tasks:
+            return []
+        
+        user_ids = {task.created_by for task in tasks}
+        user_ids.update(task.assigned_to for task in tasks if task.assigned_to)
+        
+        return Task.to_dicts(tasks, UserCache.get_many(user_ids))
+    
     @staticmethod
     def create_task(data: Dict[str, Any], created_by_id: int) -> Task:
         """
@@ -24,7 +187,7 @@ class TaskService:
         
         Args:
             data: Dictionary with task fields (title, description, etc.)
-            created_by_id: User ID of task creator
+            created_by_id: User ID of task creator (int, or the JWT's str identity)
             
         Returns:
             Task: Created task object
@@ -35,16 +198,14 @@ class TaskService:
         # Validate input data
         validated_data = validate_task_data(data, required_fields=['title'])
         
-        # Verify creator exists
-        creator = User.query.get(created_by_id)
-        if not creator:
-            raise ValueError(f"User with ID {created_by_id} not found")
+        # JWT identities are strings (flask-jwt-extended requires a str 'sub')
+        created_by_id = int(created_by_id)
         
-        # Verify assignee exists (if provided)
-        if 'assigned_to' in validated_data and validated_data['assigned_to']:
-            assignee = User.query.get(validated_data['assigned_to'])
-            if not assignee:
-                raise ValueError(f"Assignee with ID {validated_data['assigned_to']} not found")
+        # Verify creator and assignee (if provided) exist - one query for both
+        TaskService._verify_users_exist(
+            creator_id=created_by_id,
+            assignee_id=validated_data.get('assigned_to')
+        )
         
         # Create task object
         task = Task(
@@ -58,12 +219,79 @@ class TaskService:
             created_by=created_by_id
         )
         
-        # Save to database
+        # Save to database. The flush runs the INSERT, which hands back the new
+        # ID (INSERT ... RETURNING); reading task.id after commit would instead
+        # refresh the expired instance with an extra SELECT
         db.session.add(task)
-        db.session.commit()
+        try:
+            db.session.flush()
+            task_id = task.id
+            db.session.commit()
+        except IntegrityError:
+            TaskService._reject_missing_users(created_by_id, task.assigned_to)
         
+        # Reload with assignee/creator for the response (and the task cache)
+        task = TaskService.get_task_by_id(task_id)
+        TaskService._cache_task(task)
         return task
     
+    @staticmethod
+    def _verify_users_exist(
+        creator_id: Optional[int] = None,
+        assignee_id: Optional[int] = None
+    ) -> None:
+        """
+        Check that the given users exist, with at most one ID IN (...) query.
+        
+        Goes through UserCache, so users seen recently (the creator is the
+        current user, and assignees appear on their task lists) cost no
+        query at all. The foreign keys still back this up in the database.
+        
+        Args:
+            creator_id: Task creator's user ID, int or numeric str (optional)
+            assignee_id: Assignee's user ID, int or numeric str (optional;
+                falsy means unassigned)
+            
+        Raises:
+            ValueError: If the creator or assignee doesn't exist
+        """
+        # IDs may arrive as strings (JWT identity); users are keyed by int
+        creator_id = int(creator_id) if creator_id else None
+        assignee_id = int(assignee_id) if assignee_id else None
+        
+        user_ids = {user_id for user_id in (creator_id, assignee_id) if user_id}
+        if not user_ids:
+            return
+        
+        found = UserCache.get_many(user_ids)
+        
+        if creator_id and creator_id not in found:
+            raise ValueError(f"User with ID {creator_id} not found")
+        if assignee_id and assignee_id not in found:
+            raise ValueError(f"Assignee with ID {assignee_id} not found")
+    
+    @staticmethod
+    def _reject_missing_users(*user_ids: Optional[int]) -> None:
+        """
+        Handle a foreign key violation on a task's creator/assignee.
+        
+        _verify_users_exist can pass on a cached entry for a user that was
+        deleted outside the ORM (so UserCache was never told). The database
+        then rejects the write: roll back, forget the cached users so the
+        next attempt checks the database, and report it as a client error.
+        
+        Args:
+            user_ids: The creator/assignee IDs the write referenced
+            
+        Raises:
+            ValueError: Always
+        """
+        db.session.rollback()
+        for user_id in user_ids:
+            if user_id:
+                UserCache.invalidate(user_id)
+        raise ValueError("Creator or assignee no longer exists")
+    
     @staticmethod
     def get_task_by_id(task_id: int) -> Optional[Task]:
         """
@@ -72,10 +300,73 @@ class TaskService:
         Args:
             task_id: Task ID to retrieve
             
+        Loads the assignee and creator in the same query, so the result can
+        be serialized with to_dict().
+        
         Returns:
             Task: Task object if found, None otherwise
         """
-        return Task.query.get(task_id)
+        # populate_existing: also (re)load the users for a task that is
+        # already in the session, e.g. right after create/update
+        return db.session.get(
+            Task, task_id,
+            options=TaskService._DETAIL_OPTIONS,
+            populate_existing=True
+        )
+    
+    @staticmethod
+    def get_task_dict(task_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Serialized task by ID, served from the shared cache when possible.
+        
+        The task's own fields are cached under task:{id} (write-through: kept
+        current by create_task/update_task, dropped by delete_task). Its
+        assignee/creator come from UserCache on every read, so user changes
+        show up immediately. Cached entries that reference a user who no
+        longer exists (deleted users cascade to their tasks in the database)
+        are reloaded instead.
+        
+        Args:
+            task_id: Task ID to retrieve
+            
+        Returns:
+            dict: Task dictionary (the to_dict() shape) if found, None otherwise
+        """
+        entry = cache.get(TaskService._task_cache_key(task_id))
+        if entry is not None:
+            user_map = UserCache.get_many(
+                user_id for user_id in (entry['created_by'], entry['assigned_to']) if user_id
+            )
+            if entry['created_by'] in user_map and (
+                not entry['assigned_to'] or entry['assigned_to'] in user_map
+            ):
+                return {
+                    **entry,
+                    'assignee': user_map.get(entry['assigned_to']),
+                    'creator': user_map[entry['created_by']]
+                }
+        
+        task = TaskService.get_task_by_id(task_id)
+        if task is None:
+            return None
+        return TaskService._cache_task(task)
+    
+    @staticmethod
+    def _task_cache_key(task_id: int) -> str:
+        """Cache key for a single task"""
+        return f'task:{task_id}'
+    
+    @staticmethod
+    def _cache_task(task: Task) -> Dict[str, Any]:
+        """
+        Store a task (loaded with its users) in the shared cache.
+        
+        Returns:
+            dict: The task's to_dict() output
+        """
+        data = task.to_dict()
+        cache.set(TaskService._task_cache_key(task.id), data, timeout=TASK_CACHE_TIMEOUT)
+        return data
     
     @staticmethod
     def get_all_tasks(
@@ -84,26 +375,55 @@ class TaskService:
         priority: Optional[str] = None,
         category: Optional[str] = None,
         assigned_to: Optional[int] = None,
-        page: int = 1,
-        per_page: int = 20
+        page: Optional[int] = 1,
+        per_page: int = 20,
+        cursor: Optional[str] = None,
+        include_total: bool = False
     ) -> Dict[str, Any]:
         """
         Get filtered and paginated list of tasks.
         
+        Tasks are ordered by due date (nearest first, NULLs last), then newest
+        first, with the ID as tiebreaker so the order is total.
+        
+        Page mode (default) runs ONE query. Counting all matches is opt-in
+        (include_total): it makes the database visit every matching row
+        instead of stopping after the page. Without it, one extra row is
+        fetched to tell whether a next page exists; with it, the page rows
+        carry the total as a window function (count(*) OVER ()) rather than a
+        separate SELECT count(*) round-trip.
+        
+        Cursor mode (page=None, cursor=<next_cursor from a previous response>)
+        continues right after the row the cursor was taken from with a WHERE
+        condition on the sort keys, so deep pages cost an index seek instead
+        of scanning and discarding OFFSET rows.
+        
         Args:
             user_id: Filter by creator (optional)
             status: Filter by status (optional)
             priority: Filter by priority (optional)
             category: Filter by category (optional)
             assigned_to: Filter by assignee (optional)
-            page: Page number (1-indexed)
+            page: Page number (1-indexed); None to use cursor mode
             per_page: Items per page
+            cursor: Opaque cursor of the previous page (cursor mode)
+            include_total: Also count all matches (page mode only)
             
         Returns:
-            dict: Contains 'tasks', 'total', 'page', 'per_page', 'pages'
+            dict: Page mode: 'tasks', 'page', 'per_page', 'has_next',
+                  'next_cursor' (+ 'total', 'pages' with include_total)
+                  Cursor mode: 'tasks', 'per_page', 'next_cursor'
+                  (next_cursor is None on the last page)
+            
+        Raises:
+            ValueError: If the cursor is malformed
         """
-        # Start with base query
-        query = Task.query
+        # Same defaults as Flask-SQLAlchemy's paginate(error_out=False)
+        if per_page < 1:
+            per_page = 20
+        
+        # Start with base query (users are batch-loaded during serialization)
+        query = Task.query.options(*TaskService._LIST_OPTIONS)
         
         # Apply filters
         if user_id:
@@ -127,22 +447,67 @@ class TaskService:
         # Order by due date (nearest first), then by creation date
         query = query.order_by(
             Task.due_date.asc().nullslast(),  # NULL due dates go last
-            Task.created_at.desc()
+            Task.created_at.desc(),
+            Task.id.desc()  # Tiebreaker: cursors need a total order
         )
         
-        # Paginate results
-        pagination = query.paginate(
-            page=page,
-            per_page=per_page,
-            error_out=False  # Don't raise error if page out of range
-        )
+        if page is None and cursor is not None:
+            # Cursor mode: only rows sorting after the cursor row
+            query = query.filter(_after_cursor(*_decode_cursor(cursor)))
+            
+            # Fetch one extra row to learn whether another page exists
+            tasks = query.limit(per_page + 1).all()
+            has_next = len(tasks) > per_page
+            tasks = tasks[:per_page]
+            
+            return {
+                'tasks': TaskService.serialize_tasks(tasks),
+                'per_page': per_page,
+                'next_cursor': _encode_cursor(tasks[-1]) if has_next else None
+            }
+        
+        page = max(page or 1, 1)
+        offset = (page - 1) * per_page
+        
+        if not include_total:
+            # Fetch one extra row to learn whether another page exists
+            tasks = query.limit(per_page + 1).offset(offset).all()
+            has_next = len(tasks) > per_page
+            tasks = tasks[:per_page]
+            
+            return {
+                'tasks': TaskService.serialize_tasks(tasks),
+                'page': page,
+                'per_page': per_page,
+                'has_next': has_next,
+                # Lets clients switch to cursor mode for the following pages
+                'next_cursor': _encode_cursor(tasks[-1]) if has_next else None
+            }
+        
+        # Page rows + total in one query: each row is (Task, total)
+        rows = query.add_columns(func.count().over().label('total')) \
+            .limit(per_page).offset(offset).all()
+        
+        if rows:
+            total = rows[0].total
+        elif page > 1:
+            # Past the last page there are no rows to carry the window count
+            total = query.order_by(None).count()
+        else:
+            total = 0
+        
+        tasks = [row[0] for row in rows]
+        pages = math.ceil(total / per_page)
+        has_next = page < pages
         
         return {
-            'tasks': [task.to_dict() for task in pagination.items],
-            'total': pagination.total,
-            'page': pagination.page,
-            'per_page': pagination.per_page,
-            'pages': pagination.pages
+            'tasks': TaskService.serialize_tasks(tasks),
+            'total': total,
+            'page': page,
+            'per_page': per_page,
+            'pages': pages,
+            'has_next': has_next,
+            'next_cursor': _encode_cursor(tasks[-1]) if tasks and has_next else None
         }
     
     @staticmethod
@@ -159,35 +524,53 @@ class TaskService:
             Task: Updated task object
             
         Raises:
-            ValueError: If task not found or validation fails
+            ValueError: If validation fails
+            TaskNotFoundError: If task not found
             PermissionError: If user doesn't have permission to update
         """
-        # Retrieve task
-        task = Task.query.get(task_id)
-        if not task:
-            raise ValueError(f"Task with ID {task_id} not found")
-        
-        # Permission check: Only creator or assignee can update
-        if task.created_by != user_id and task.assigned_to != user_id:
-            raise PermissionError("You don't have permission to update this task")
-        
         # Validate update data (fields are optional for updates)
         validated_data = validate_task_data(data)
         
         # Verify assignee exists if being changed
-        if 'assigned_to' in validated_data and validated_data['assigned_to']:
-            assignee = User.query.get(validated_data['assigned_to'])
-            if not assignee:
-                raise ValueError(f"Assignee with ID {validated_data['assigned_to']} not found")
+        TaskService._verify_users_exist(assignee_id=validated_data.get('assigned_to'))
         
-        # Update fields
-        for field, value in validated_data.items():
-            if hasattr(task, field):
-                setattr(task, field, value)
+        # Only allow-listed fields can be updated (other keys are ignored)
+        values = {
+            field: value for field, value in validated_data.items()
+            if field in TaskService._TASK_UPDATABLE
+        }
         
-        # Save changes
-        db.session.commit()
+        # Update + permission check in ONE statement: the row is only changed
+        # if the user is its creator or assignee. Only the ID comes back - the
+        # response is reloaded below with its users, so returning (and syncing
+        # into the session) the full row would be wasted transfer
+        stmt = (
+            update(Task)
+            .where(
+                Task.id == task_id,
+                or_(Task.created_by == user_id, Task.assigned_to == user_id)
+            )
+            .values(**values)
+            .returning(Task.id)
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            updated_id = db.session.execute(stmt).scalar_one_or_none()
+            
+            if updated_id is None:
+                db.session.rollback()
+                TaskService._raise_missing_or_forbidden(
+                    task_id, "You don't have permission to update this task"
+                )
+            
+            # Save changes
+            db.session.commit()
+        except IntegrityError:
+            TaskService._reject_missing_users(values.get('assigned_to'))
         
+        # Reload with assignee/creator for the response (and the task cache)
+        task = TaskService.get_task_by_id(task_id)
+        TaskService._cache_task(task)
         return task
     
     @staticmethod
@@ -203,49 +586,138 @@ class TaskService:
             bool: True if deleted successfully
             
         Raises:
-            ValueError: If task not found
+            TaskNotFoundError: If task not found
             PermissionError: If user doesn't have permission
         """
-        # Retrieve task
-        task = Task.query.get(task_id)
-        if not task:
-            raise ValueError(f"Task with ID {task_id} not found")
+        # Hard delete (for now - could implement soft delete with is_deleted flag)
+        # Permission check is part of the statement: only the creator's row matches
+        stmt = (
+            delete(Task)
+            .where(Task.id == task_id, Task.created_by == user_id)
+            .returning(Task.id)
+        )
+        deleted_id = db.session.execute(stmt).scalar_one_or_none()
         
-        # Permission check: Only creator can delete
-        if task.created_by != user_id:
-            raise PermissionError("Only the task creator can delete this task")
+        if deleted_id is None:
+            db.session.rollback()
+            TaskService._raise_missing_or_forbidden(
+                task_id, "Only the task creator can delete this task"
+            )
         
-        # Hard delete (for now - could implement soft delete with is_deleted flag)
-        db.session.delete(task)
         db.session.commit()
+        cache.delete(TaskService._task_cache_key(task_id))
         
         return True
     
+    @staticmethod
+    def _raise_missing_or_forbidden(task_id: int, permission_message: str) -> None:
+        """
+        Explain why a permission-filtered UPDATE/DELETE matched no row.
+        
+        Only runs on the failure path: one cheap existence probe tells a
+        missing task apart from one the user may not touch.
+        
+        Raises:
+            TaskNotFoundError: If the task doesn't exist
+            PermissionError: If it exists (so the user lacked permission)
+        """
+        if not db.session.query(exists().where(Task.id == task_id)).scalar():
+            raise TaskNotFoundError(f"Task with ID {task_id} not found")
+        raise PermissionError(permission_message)
+    
     @staticmethod
     def search_tasks(search_term: str, user_id: Optional[int] = None) -> List[Task]:
         """
         Search tasks by title or description.
         
+        Matches case-insensitive substrings of title/description. On
+        PostgreSQL, full-text word-prefix matches are included as well and
+        results are ranked by relevance then newest first (all index-backed:
+        search_vector and pg_trgm GIN indexes). Elsewhere results are ordered
+        newest first.
+        
+        Terms shorter than MIN_SEARCH_LENGTH (after stripping) match nothing,
+        without querying the database.
+        
         Args:
             search_term: Text to search for
             user_id: Limit search to user's tasks (optional)
             
         Returns:
-            list: List of matching Task objects
+            list: List of matching Task objects (relationships not loaded;
+                serialize with serialize_tasks)
         """
-        # Build search query (case-insensitive)
+        search_term = search_term.strip()
+        if len(search_term) < MIN_SEARCH_LENGTH:
+            return []
+        return TaskService._search_query(search_term, user_id).all()
+    
+    @staticmethod
+    def iter_search_results(
+        search_term: str,
+        user_id: Optional[int] = None,
+        batch_size: int = 200
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Search like search_tasks, yielding serialized tasks batch by batch.
+        
+        Rows are streamed from the database (yield_per) and each batch is
+        serialized with one users query, so memory stays bounded by
+        batch_size no matter how many tasks match.
+        
+        Args:
+            search_term: Text to search for
+            user_id: Limit search to user's tasks (optional)
+            batch_size: Tasks per yielded batch
+            
+        Yields:
+            list: Task dictionaries (non-empty), in result order; nothing for
+                terms shorter than MIN_SEARCH_LENGTH
+        """
+        search_term = search_term.strip()
+        if len(search_term) < MIN_SEARCH_LENGTH:
+            return
+        rows = iter(TaskService._search_query(search_term, user_id).yield_per(batch_size))
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                return
+            yield TaskService.serialize_tasks(batch)
+    
+    @staticmethod
+    def _search_query(search_term: str, user_id: Optional[int] = None):
+        """Build the ordered search query shared by the search methods"""
+        query = Task.query.options(*TaskService._LIST_OPTIONS)
+        
+        # Case-insensitive substring match
+        # (on PostgreSQL backed by the pg_trgm GIN indexes on both columns)
         search_pattern = f"%{search_term}%"
-        query = Task.query.filter(
-            or_(
-                Task.title.ilike(search_pattern),
-                Task.description.ilike(search_pattern)
-            )
+        substring_match = or_(
+            Task.title.ilike(search_pattern),
+            Task.description.ilike(search_pattern)
         )
         
+        # PostgreSQL: also full-text search on the GIN-indexed search_vector
+        # column. Every word is matched as a prefix ("doc" matches
+        # "documentation") and gives the relevance ranking; the substring match
+        # keeps terms found inside words. Both sides are index scans (BitmapOr).
+        ts_query = _prefix_tsquery(search_term)
+        if ts_query is not None and not _has_search_vector(db.engine):
+            ts_query = None  # Not migrated yet: substring match only
+        
+        if ts_query is not None:
+            query = query.filter(or_(task_search_vector.op('@@')(ts_query), substring_match))
+            order_by = (func.ts_rank(task_search_vector, ts_query).desc(), Task.created_at.desc())
+        else:
+            # Other databases (or no words / no search_vector column):
+            # substring match only, newest first
+            query = query.filter(substring_match)
+            order_by = (Task.created_at.desc(),)
+        
         # Filter by user if specified
         if user_id:
             query = query.filter(
                 or_(Task.created_by == user_id, Task.assigned_to == user_id)
             )
         
-        return query.order_by(Task.created_at.desc()).all()
\ No newline at end of file
+        return query.order_by(*order_by)
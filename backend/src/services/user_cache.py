@@ -0,0 +1,89 @@
+"""
+Purpose: Shared cache of the public user fields embedded in task responses.
+Depends on: cache extension (Redis in production), User model
+Used by: TaskService.serialize_tasks
+"""
+from typing import Dict, Any, Iterable
+from sqlalchemy import event
+from backend.src.extensions import db, cache
+from backend.src.models.user import User
+
+# How long a cached user entry lives (seconds). Entries are also dropped as
+# soon as the user row is updated or deleted, so this only bounds staleness
+# for changes made outside the ORM.
+USER_CACHE_TIMEOUT = 300
+
+
+class UserCache:
+    """
+    Cache of {'id', 'username', 'email'} dicts keyed by user ID.
+
+    Task lists embed the same few creators/assignees on every page, so their
+    user fields are kept in the shared cache (one MGET via cache.get_many) and
+    only users missing from it are loaded, in one SELECT ... WHERE id IN (...).
+    """
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        """Cache key for a single user"""
+        return f'user:{user_id}'
+
+    @staticmethod
+    def get_many(user_ids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Get the public fields of several users.
+
+        Args:
+            user_ids: User IDs to look up, int or numeric str (duplicates are
+                ignored)
+
+        Returns:
+            dict: {int user_id: user dict}; IDs with no matching user are left out
+        """
+        # Always key by int: cache hits and database rows must land under the
+        # same keys whatever type the caller passed (JWT identities are str)
+        user_ids = list({int(user_id) for user_id in user_ids})
+        if not user_ids:
+            return {}
+
+        cached = cache.get_many(*[UserCache._key(user_id) for user_id in user_ids])
+        user_map = {
+            user_id: entry
+            for user_id, entry in zip(user_ids, cached)
+            if entry is not None
+        }
+
+        missing = [user_id for user_id in user_ids if user_id not in user_map]
+        if missing:
+            rows = db.session.query(User.id, User.username, User.email).filter(
+                User.id.in_(missing)
+            ).all()
+            loaded = {
+                row.id: {'id': row.id, 'username': row.username, 'email': row.email}
+                for row in rows
+            }
+            if loaded:
+                cache.set_many(
+                    {UserCache._key(user_id): entry for user_id, entry in loaded.items()},
+                    timeout=USER_CACHE_TIMEOUT
+                )
+            user_map.update(loaded)
+
+        return user_map
+
+    @staticmethod
+    def invalidate(user_id: int) -> None:
+        """
+        Drop a user's cached entry.
+
+        Args:
+            user_id: User ID whose entry is stale
+        """
+        cache.delete(UserCache._key(user_id))
+
+
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def _invalidate_cached_user(mapper, connection, target) -> None:
+    """Forget a user's cached fields whenever the ORM changes the row"""
+    UserCache.invalidate(target.id)
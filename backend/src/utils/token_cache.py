@@ -0,0 +1,92 @@
+"""
+JWT verification cache.
+Clients send the same access token on every request until it expires, so the
+decoded claims are cached by the token's SHA-256 digest instead of parsing and
+verifying the token again each time.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from flask import current_app
+from flask_jwt_extended import JWTManager
+
+
+class CachingJWTManager(JWTManager):
+    """
+    JWTManager that remembers successfully verified tokens.
+
+    Only the signature/claims decode step is cached. Everything
+    flask-jwt-extended does after decoding (token type checks, blocklist and
+    user lookup callbacks, freshness) still runs on every request.
+
+    Each app gets its own cache (stored in app.extensions), so a token
+    verified with one app's secret is never accepted by another app.
+    Entries are dropped once the token's exp has passed; a fresh decode then
+    raises ExpiredSignatureError as usual.
+
+    Config:
+        JWT_VERIFY_CACHE_SIZE: Max cached tokens per app (0 disables the cache)
+    """
+
+    def init_app(self, app) -> None:
+        """Register the extension and create the app's token cache"""
+        super().init_app(app)
+        app.config.setdefault('JWT_VERIFY_CACHE_SIZE', 4096)
+        app.extensions['jwt_verify_cache'] = _TokenCache(app.config['JWT_VERIFY_CACHE_SIZE'])
+
+    def _decode_jwt_from_config(
+        self, encoded_token: str, csrf_value: Optional[str] = None, allow_expired: bool = False
+    ) -> Dict[str, Any]:
+        """Decode and verify a token, reusing the result for repeated tokens"""
+        token_cache = current_app.extensions.get('jwt_verify_cache')
+
+        # CSRF-checked (cookie) and allow_expired decodes are rare; don't cache them
+        if token_cache is None or not token_cache.maxsize or csrf_value is not None or allow_expired:
+            return super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+
+        key = hashlib.sha256(encoded_token.encode('utf-8')).digest()
+        claims = token_cache.get(key)
+        if claims is not None:
+            return dict(claims)  # Copy so callers can't alter the cached claims
+
+        claims = super()._decode_jwt_from_config(encoded_token, csrf_value, allow_expired)
+
+        # Tokens without an expiry can't be evicted on time, so they aren't cached
+        exp = claims.get('exp')
+        if exp is not None:
+            token_cache.set(key, claims, exp)
+
+        return dict(claims)
+
+
+class _TokenCache:
+    """Thread-safe LRU of {token digest: (exp, claims)} with expiry on read"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[bytes, Tuple[float, Dict[str, Any]]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """Return cached claims, or None if missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: bytes, claims: Dict[str, Any], exp: float) -> None:
+        """Cache claims until exp (UNIX timestamp), evicting the least recently used"""
+        with self._lock:
+            self._entries[key] = (exp, claims)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
@@ -0,0 +1,296 @@
+"""
+API tests for the task endpoints, run against an in-memory SQLite database.
+
+Tokens are issued exactly like the auth flow does (string identity,
+flask-jwt-extended's default sub verification), so the views see the same
+JWT identities as in production.
+
+Usage:
+    python -m unittest discover -s backend/tests -t .
+"""
+import os
+import unittest
+
+# Must be set before backend.config is imported (it reads the URL at import)
+os.environ['DATABASE_URL'] = 'sqlite://'
+
+from flask_jwt_extended import create_access_token
+from sqlalchemy import text
+
+from backend.app import create_app
+from backend.src.extensions import db
+from backend.src.models.user import User
+
+
+class TaskApiTestCase(unittest.TestCase):
+    """Task endpoints through the real JWT path, with a fresh app and cache per test"""
+
+    def setUp(self):
+        self.app = create_app('development')
+        self.client = self.app.test_client()
+
+        with self.app.app_context():
+            db.create_all()
+            creator = User(username='alice', email='alice@example.com')
+            assignee = User(username='bob', email='bob@example.com')
+            outsider = User(username='carol', email='carol@example.com')
+            for user in (creator, assignee, outsider):
+                user.set_password('password123')
+            db.session.add_all([creator, assignee, outsider])
+            db.session.commit()
+            self.creator_id = creator.id
+            self.assignee_id = assignee.id
+            self.headers = self._auth(creator.id)
+            self.assignee_headers = self._auth(assignee.id)
+            self.outsider_headers = self._auth(outsider.id)
+
+    def tearDown(self):
+        with self.app.app_context():
+            db.session.remove()
+            db.drop_all()
+
+    @staticmethod
+    def _auth(user_id):
+        """Authorization header for a user (call inside an app context)"""
+        token = create_access_token(identity=str(user_id))
+        return {'Authorization': f'Bearer {token}'}
+
+    def _create_task(self, title, **fields):
+        """Create a task as the creator and return its ID"""
+        response = self.client.post(
+            '/api/tasks', json={'title': title, **fields}, headers=self.headers
+        )
+        self.assertEqual(response.status_code, 201, response.get_json())
+        return response.get_json()['task']['id']
+
+    def test_create_task_with_string_jwt_identity(self):
+        """A cold user cache must not make the creator look missing"""
+        response = self.client.post('/api/tasks', json={
+            'title': 'Write docs',
+            'assigned_to': self.assignee_id
+        }, headers=self.headers)
+
+        self.assertEqual(response.status_code, 201, response.get_json())
+        task = response.get_json()['task']
+        self.assertEqual(task['created_by'], self.creator_id)
+        self.assertEqual(task['creator']['id'], self.creator_id)
+        self.assertEqual(task['assignee']['id'], self.assignee_id)
+
+    def test_create_task_again_with_warm_cache(self):
+        """The second create (users now cached) behaves the same"""
+        for title in ('First', 'Second'):
+            response = self.client.post('/api/tasks', json={'title': title}, headers=self.headers)
+            self.assertEqual(response.status_code, 201, response.get_json())
+
+    def test_create_task_unknown_assignee(self):
+        """An assignee that doesn't exist is a 400, not a 500"""
+        response = self.client.post('/api/tasks', json={
+            'title': 'Write docs',
+            'assigned_to': 999
+        }, headers=self.headers)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['error'], 'Assignee with ID 999 not found')
+
+    def test_create_task_for_user_deleted_outside_the_orm(self):
+        """A stale cached user makes the FK reject the INSERT: 400, not 500"""
+        with self.app.app_context():
+            # SQLite only enforces foreign keys when asked to
+            db.session.execute(text('PRAGMA foreign_keys=ON'))
+
+        payload = {'title': 'Write docs', 'assigned_to': self.assignee_id}
+        response = self.client.post('/api/tasks', json=payload, headers=self.headers)
+        self.assertEqual(response.status_code, 201)  # Assignee is now cached
+
+        with self.app.app_context():
+            # Raw SQL: no ORM after_delete event, so UserCache isn't told
+            db.session.execute(text('DELETE FROM users WHERE id = :id'), {'id': self.assignee_id})
+            db.session.commit()
+
+        response = self.client.post('/api/tasks', json=payload, headers=self.headers)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['error'], 'Creator or assignee no longer exists')
+
+        # The stale entry was dropped, so the next attempt checks the database
+        response = self.client.post('/api/tasks', json=payload, headers=self.headers)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.get_json()['error'], f'Assignee with ID {self.assignee_id} not found'
+        )
+
+    # ------------------------------------------------------------------
+    # Update / delete permissions
+    # ------------------------------------------------------------------
+
+    def test_update_task_by_assignee(self):
+        task_id = self._create_task('Write docs', assigned_to=self.assignee_id)
+
+        response = self.client.put(
+            f'/api/tasks/{task_id}', json={'status': 'completed'}, headers=self.assignee_headers
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['task']['status'], 'completed')
+
+    def test_update_task_by_outsider_is_forbidden(self):
+        task_id = self._create_task('Write docs', assigned_to=self.assignee_id)
+
+        response = self.client.put(
+            f'/api/tasks/{task_id}', json={'status': 'completed'}, headers=self.outsider_headers
+        )
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(
+            response.get_json()['error'], "You don't have permission to update this task"
+        )
+
+    def test_update_missing_task_is_not_found(self):
+        response = self.client.put('/api/tasks/999', json={'status': 'completed'}, headers=self.headers)
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.get_json()['error'], 'Task with ID 999 not found')
+
+    def test_delete_task_by_assignee_is_forbidden(self):
+        task_id = self._create_task('Write docs', assigned_to=self.assignee_id)
+
+        response = self.client.delete(f'/api/tasks/{task_id}', headers=self.assignee_headers)
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.get_json()['error'], 'Only the task creator can delete this task')
+
+    def test_delete_task_by_creator(self):
+        task_id = self._create_task('Write docs')
+
+        response = self.client.delete(f'/api/tasks/{task_id}', headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(f'/api/tasks/{task_id}', headers=self.headers)
+        self.assertEqual(response.status_code, 404)
+
+    def test_delete_missing_task_is_not_found(self):
+        response = self.client.delete('/api/tasks/999', headers=self.headers)
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.get_json()['error'], 'Task with ID 999 not found')
+
+    # ------------------------------------------------------------------
+    # Pagination
+    # ------------------------------------------------------------------
+
+    def test_cursor_pagination_walks_every_task_once(self):
+        for i in range(5):
+            self._create_task(f'Task {i}', due_date=f'2030-01-0{i % 3 + 1}T00:00:00')
+
+        full = self.client.get('/api/tasks', headers=self.headers).get_json()
+        expected_ids = [task['id'] for task in full['tasks']]
+
+        walked_ids = []
+        response = self.client.get('/api/tasks?per_page=2', headers=self.headers).get_json()
+        while True:
+            walked_ids.extend(task['id'] for task in response['tasks'])
+            if not response['next_cursor']:
+                break
+            response = self.client.get(
+                f"/api/tasks?per_page=2&cursor={response['next_cursor']}", headers=self.headers
+            ).get_json()
+
+        self.assertEqual(walked_ids, expected_ids)
+        self.assertEqual(len(walked_ids), 5)
+
+    def test_invalid_cursor_is_bad_request(self):
+        response = self.client.get('/api/tasks?cursor=not-a-cursor', headers=self.headers)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['error'], 'Invalid pagination cursor')
+
+    def test_default_page_response_has_no_total(self):
+        """total/pages are opt-in (include_total); has_next/next_cursor always come back"""
+        for i in range(3):
+            self._create_task(f'Task {i}')
+
+        data = self.client.get('/api/tasks?per_page=2', headers=self.headers).get_json()
+        self.assertEqual(set(data), {'tasks', 'page', 'per_page', 'has_next', 'next_cursor'})
+        self.assertTrue(data['has_next'])
+        self.assertIsNotNone(data['next_cursor'])
+
+    def test_include_total_adds_total_and_pages(self):
+        for i in range(3):
+            self._create_task(f'Task {i}')
+
+        data = self.client.get('/api/tasks?per_page=2&include_total=true', headers=self.headers).get_json()
+        self.assertEqual(
+            set(data), {'tasks', 'page', 'per_page', 'has_next', 'next_cursor', 'total', 'pages'}
+        )
+        self.assertEqual(data['total'], 3)
+        self.assertEqual(data['pages'], 2)
+        self.assertTrue(data['has_next'])
+
+    def test_include_total_past_the_last_page(self):
+        for i in range(3):
+            self._create_task(f'Task {i}')
+
+        response = self.client.get('/api/tasks?page=7&include_total=true', headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual(data['tasks'], [])
+        self.assertEqual(data['total'], 3)
+        self.assertEqual(data['pages'], 1)
+        self.assertEqual(data['page'], 7)
+        self.assertFalse(data['has_next'])
+
+    # ------------------------------------------------------------------
+    # Conditional requests and response cache
+    # ------------------------------------------------------------------
+
+    def test_if_none_match_returns_not_modified(self):
+        self._create_task('Write docs')
+
+        response = self.client.get('/api/tasks', headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers['ETag']
+
+        response = self.client.get(
+            '/api/tasks', headers={**self.headers, 'If-None-Match': etag}
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b'')
+
+    def test_write_invalidates_cached_responses(self):
+        task_id = self._create_task('Write docs')
+        self.assertEqual(len(self.client.get('/api/tasks', headers=self.headers).get_json()['tasks']), 1)
+        self.client.get(f'/api/tasks/{task_id}', headers=self.headers)  # Cache it
+
+        self._create_task('Review docs')
+        self.client.put(f'/api/tasks/{task_id}', json={'title': 'Rewrite docs'}, headers=self.headers)
+
+        tasks = self.client.get('/api/tasks', headers=self.headers).get_json()['tasks']
+        self.assertEqual(len(tasks), 2)
+        task = self.client.get(f'/api/tasks/{task_id}', headers=self.headers).get_json()['task']
+        self.assertEqual(task['title'], 'Rewrite docs')
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def test_search_shorter_than_minimum_is_bad_request(self):
+        response = self.client.get('/api/tasks/search?q=ab', headers=self.headers)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.get_json()['error'], 'Search query (q) must be at least 3 characters'
+        )
+
+    def test_search_result_shape(self):
+        first_id = self._create_task('Write docs', description='API documentation')
+        second_id = self._create_task('Docs review')
+        self._create_task('Unrelated')
+
+        response = self.client.get('/api/tasks/search?q=docs', headers=self.headers)
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual(set(data), {'query', 'tasks', 'count'})
+        self.assertEqual(data['query'], 'docs')
+        self.assertEqual(data['count'], 2)
+        self.assertEqual([task['id'] for task in data['tasks']], [second_id, first_id])  # Newest first
+        self.assertEqual(data['tasks'][0]['creator']['id'], self.creator_id)
+
+        # Served again from the response cache: same body
+        again = self.client.get('/api/tasks/search?q=docs', headers=self.headers)
+        self.assertEqual(again.get_json(), data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+Unit tests for TaskService query building, checked at the compiled-SQL level.
+
+PostgreSQL-only SQL (full-text search) is compiled with the PostgreSQL
+dialect, so these tests need no PostgreSQL server.
+
+Usage:
+    python -m unittest discover -s backend/tests -t .
+"""
+import os
+import unittest
+
+# Must be set before backend.config is imported (it reads the URL at import)
+os.environ['DATABASE_URL'] = 'sqlite://'
+
+from sqlalchemy.dialects import postgresql
+
+from backend.app import create_app
+from backend.src.extensions import db
+from backend.src.services import task_service
+from backend.src.services.task_service import TaskService, _has_search_vector, _prefix_tsquery
+
+
+def _postgresql_sql(clause) -> str:
+    """
+    Compile a SQL expression for PostgreSQL with parameters inlined.
+    
+    Inlined by hand: literal_binds can't render to_tsquery's REGCONFIG argument.
+    """
+    compiled = clause.compile(dialect=postgresql.dialect())
+    return compiled.string % {name: repr(value) for name, value in compiled.params.items()}
+
+
+class PrefixTsqueryTestCase(unittest.TestCase):
+    """The to_tsquery() text built from a search term"""
+
+    def test_words_become_prefix_terms(self):
+        self.assertEqual(
+            _postgresql_sql(_prefix_tsquery('api doc')),
+            "to_tsquery('english'::REGCONFIG, 'api:* & doc:*'::VARCHAR)"
+        )
+
+    def test_underscore_terms_stay_one_word(self):
+        self.assertEqual(
+            _postgresql_sql(_prefix_tsquery('due_date field')),
+            "to_tsquery('english'::REGCONFIG, 'due_date:* & field:*'::VARCHAR)"
+        )
+
+    def test_stop_word_only_terms_are_passed_through(self):
+        # PostgreSQL drops the stop words and matches nothing on this side;
+        # the substring match still finds rows
+        self.assertEqual(
+            _postgresql_sql(_prefix_tsquery('the and')),
+            "to_tsquery('english'::REGCONFIG, 'the:* & and:*'::VARCHAR)"
+        )
+
+    def test_tsquery_operators_are_stripped(self):
+        self.assertEqual(
+            _postgresql_sql(_prefix_tsquery("doc & !api | (x):*")),
+            "to_tsquery('english'::REGCONFIG, 'doc:* & api:* & x:*'::VARCHAR)"
+        )
+
+    def test_no_words_means_no_tsquery(self):
+        self.assertIsNone(_prefix_tsquery('&&& !!!'))
+
+
+class SearchQueryTestCase(unittest.TestCase):
+    """_search_query only uses search_vector when the column exists"""
+
+    def setUp(self):
+        self.app = create_app('development')
+        self.context = self.app.app_context()
+        self.context.push()
+        db.create_all()
+
+    def tearDown(self):
+        task_service._search_vector_available.pop(db.engine, None)
+        db.session.remove()
+        db.drop_all()
+        self.context.pop()
+
+    def _search_sql(self) -> str:
+        return _postgresql_sql(TaskService._search_query('api doc').statement)
+
+    def test_sqlite_has_no_search_vector(self):
+        self.assertFalse(_has_search_vector(db.engine))
+
+    def test_without_search_vector_only_substring_match(self):
+        sql = self._search_sql()
+        self.assertNotIn('search_vector', sql)
+        self.assertIn("ILIKE '%api doc%'", sql)
+
+    def test_with_search_vector_full_text_and_substring(self):
+        # As if running on a migrated PostgreSQL database
+        task_service._search_vector_available[db.engine] = True
+
+        sql = self._search_sql()
+        self.assertIn(
+            "tasks.search_vector @@ to_tsquery('english'::REGCONFIG, 'api:* & doc:*'::VARCHAR)", sql
+        )
+        self.assertIn("ILIKE '%api doc%'", sql)
+        self.assertIn('ORDER BY ts_rank(tasks.search_vector', sql)
+
+
+if __name__ == '__main__':
+    unittest.main()